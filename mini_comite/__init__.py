@@ -0,0 +1,3 @@
+"""
+Simulação de títulos e produtos de renda fixa sob cenários de Selic e IPCA.
+"""
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    from .config import CAPITAL_INICIAL
+    
+    parser = argparse.ArgumentParser(description="Executa simulações dos cenários e produtos.")
+    parser.add_argument("--initial", type=float, default=CAPITAL_INICIAL, help="Valor inicial (R$)")
+    parser.add_argument("--save-figures", action="store_true", help="Salvar gráficos em figures/")
+    parser.add_argument("--fig-dir", type=str, default="figures", help="Diretório para salvar gráficos")
+    parser.add_argument("--plotly", action="store_true", help="Usar Plotly para gráficos interativos")
+    parser.add_argument("--dashboard", action="store_true", help="Gerar dashboard interativo HTML")
+    parser.add_argument("--individual", action="store_true", help="Gerar gráfico individual para cada cenário")
+    parser.add_argument("--evolucao", action="store_true", help="Gerar gráficos de evolução temporal")
+    parser.add_argument("--rentabilidade", action="store_true", help="Gerar gráficos de rentabilidade por produto")
+    parser.add_argument("--save-results", action="store_true", help="Salvar resultados (pasta data/)")
+    parser.add_argument("--format", choices=["xlsx", "csv"], default="xlsx",
+                        help="Formato do --save-results: planilha por título (xlsx) ou resumos por cenário (csv)")
+    parser.add_argument("--out-dir", type=str, default="data", help="Diretório para salvar resultados")
+    parser.add_argument("--parquet", action="store_true", help="Com --save-results, salvar também uma timeline .parquet por produto")
+    parser.add_argument("--print-format", choices=["table", "csv"], default="table",
+                        help="Formato do resumo impresso na saída padrão: tabela formatada (padrão) ou CSV")
+    return parser.parse_args()
+
+
+def _build_product_frames(produto: str, results: dict, dates) -> tuple[list, list]:
+    """Monta as timelines de um produto em todos os cenários, com DATA e CENARIO.
+
+    Retorna (frames com linhas separadoras para o Excel, frames sem separadores).
+    Função pura e independente por produto.
+    """
+    import numpy as np
+    import pandas as pd
+
+    all_data = []
+    scenario_frames = []  # Mesmos dados sem separadores (para o Parquet)
+    separator = None  # Linha separadora, criada uma vez por produto (mesmas colunas em todos os cenários)
+
+    # Adiciona timelines de todos os cenários para este produto
+    for scen_name, data in results.items():
+        if produto in data["timelines"]:
+            src = data["timelines"][produto]
+            # Monta DATA/CENARIO à parte e concatena por colunas, sem copiar a timeline;
+            # o array de datas (o mesmo para todos os cenários) também entra sem cópia
+            extra = pd.DataFrame({"DATA": dates, "CENARIO": scen_name}, index=src.index, copy=False)
+            timeline_df = pd.concat([extra, src], axis=1)
+            all_data.append(timeline_df)
+            scenario_frames.append(timeline_df)
+
+            # Adiciona linha separadora entre cenários
+            if len(all_data) > 1:  # Se não for o primeiro cenário
+                if separator is None:
+                    separator = pd.DataFrame(
+                        np.full((1, len(timeline_df.columns)), "---", dtype=object),
+                        columns=timeline_df.columns,
+                    )
+                all_data.append(separator)
+
+    return all_data, scenario_frames
+
+
+def _stack_frames(frames: list):
+    """Empilha frames com as mesmas colunas em buffers NumPy pré-alocados.
+
+    Equivale a pd.concat(frames, ignore_index=True) sem o alinhamento de eixos
+    do concat. Colunas com dtypes diferentes entre os frames (ex.: linha "---")
+    ou não-NumPy viram object.
+    """
+    import numpy as np
+    import pandas as pd
+
+    total_rows = sum(len(df) for df in frames)
+    out = {}
+    for col in frames[0].columns:
+        dtypes = {df[col].dtype for df in frames}
+        dtype = dtypes.pop() if len(dtypes) == 1 else object
+        if not isinstance(dtype, np.dtype):
+            dtype = object
+        arr = np.empty(total_rows, dtype=dtype)
+        offset = 0
+        for df in frames:
+            n = len(df)
+            arr[offset:offset + n] = df[col].to_numpy()
+            offset += n
+        out[col] = arr
+    return pd.DataFrame(out, copy=False)
+
+
+def main() -> None:
+    # Argumentos primeiro: --help e erros de uso não pagam o import de pandas/plotly
+    args = parse_args()
+
+    import numpy as np
+    import pandas as pd
+    from .config import PRODUTOS, SHEET_NAMES
+    from .simulate import run_all_with_timelines
+
+    # Timelines só são montadas quando algum destino as usa (planilha/Parquet ou
+    # gráficos de evolução, rentabilidade e dashboard); os demais só leem os resumos
+    xlsx = args.format == "xlsx"
+    need_timelines = (
+        (args.save_results and (xlsx or args.parquet))
+        or args.evolucao or args.rentabilidade or args.dashboard
+    )
+    results = run_all_with_timelines(initial_value=args.initial, with_timelines=need_timelines)
+
+    # Imprime resumo por cenário (montado em buffer e escrito de uma vez).
+    # Com --print-format csv sai em CSV, mais barato e fácil de processar que a tabela
+    buf = io.StringIO()
+    table = args.print_format == "table"
+    for scen_name, data in results.items():
+        buf.write(f"\n=== {scen_name} ===\n")
+        if table:
+            buf.write(data["summary"].to_string(index=False))
+            buf.write("\n")
+        else:
+            data["summary"].to_csv(buf, index=False, lineterminator="\n")
+    sys.stdout.write(buf.getvalue())
+
+    # Salva resultados, se solicitado
+    if args.save_results:
+        out_dir = Path(args.out_dir).resolve()
+        out_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Cria planilha Excel com uma aba por título (produto)
+        excel_path = out_dir / "simulacao_por_titulo.xlsx"
+        
+        # xlsxwriter grava a planilha bem mais rápido que o openpyxl
+        # (constant_memory não serve: o pandas escreve as células coluna a coluna)
+        with (pd.ExcelWriter(excel_path, engine='xlsxwriter') if xlsx else contextlib.nullcontext()) as writer:
+            # Datas (dias úteis a partir de 2025) calculadas uma única vez: todas as timelines têm o mesmo tamanho
+            if need_timelines:
+                primeira_timeline = next(iter(next(iter(results.values()))["timelines"].values()))
+                dates = pd.bdate_range(start="2025-01-01", periods=len(primeira_timeline)).date
+            
+            # Uma aba por produto com todos os cenários (timelines só vão para xlsx/Parquet)
+            for produto in (PRODUTOS if xlsx or args.parquet else ()):
+                sheet_name = SHEET_NAMES[produto]
+                
+                all_data, scenario_frames = _build_product_frames(produto, results, dates)
+                
+                # Combina tudo em uma única aba para este produto
+                if writer is not None and all_data:
+                    combined_data = _stack_frames(all_data)
+                    combined_data.to_excel(writer, sheet_name=sheet_name, index=False)
+                
+                # Parquet (zstd): bem menor e mais rápido de reler que o xlsx
+                if args.parquet and scenario_frames:
+                    parquet_path = out_dir / f"{produto}.parquet"
+                    stacked = _stack_frames(scenario_frames)
+                    # CENARIO repete poucos nomes: categórico vira coluna de dicionário no Parquet.
+                    # Os nomes já são conhecidos (um frame por cenário, na ordem de results):
+                    # códigos montados direto, sem inferir as categorias a partir das strings
+                    nomes = [scen for scen, data in results.items() if produto in data["timelines"]]
+                    codigos = np.repeat(np.arange(len(nomes), dtype=np.int8), [len(df) for df in scenario_frames])
+                    stacked["CENARIO"] = pd.Categorical.from_codes(codigos, categories=nomes)
+                    stacked.to_parquet(
+                        parquet_path, engine="pyarrow", compression="zstd", index=False
+                    )
+            
+            # Adiciona aba de resumo com todos os cenários
+            if not xlsx:
+                # Writer CSV em C++ do pyarrow (bufferizado), mais rápido que o formatador do pandas
+                import pyarrow as pa
+                from pyarrow import csv as pacsv
+            summary_data = []
+            for scen_name, data in results.items():
+                src = data["summary"]
+                if not xlsx:
+                    slug = scen_name.replace(' ', '_').replace('-', '').lower()
+                    pacsv.write_csv(pa.Table.from_pandas(src, preserve_index=False), out_dir / f"{slug}_summary.csv")
+                extra = pd.DataFrame({"CENARIO": scen_name}, index=src.index)
+                summary_data.append(pd.concat([extra, src], axis=1))
+            
+            if summary_data:
+                combined_summary = pd.concat(summary_data, ignore_index=True)
+                if writer is not None:
+                    combined_summary.to_excel(writer, sheet_name="Resumo", index=False)
+                else:
+                    pacsv.write_csv(pa.Table.from_pandas(combined_summary, preserve_index=False), out_dir / "resumo_cenarios.csv")
+
+        # print(f"\nPlanilha por título salva em: {excel_path}")
+        # print("Estrutura: 6 abas (uma por produto) com 3 cenários simulados em cada aba")
+        # print("Cada aba contém: resumos dos 3 cenários + timelines diárias de 756 dias úteis")
+
+    # Gera gráficos, se solicitado (plotly só é importado quando há gráfico a gerar)
+    if args.save_figures or args.plotly or args.individual or args.evolucao or args.rentabilidade or args.dashboard:
+        from .plots import generate_all_plots
+        generate_all_plots(results, args, args.fig_dir)
+
+
+if __name__ == "__main__":
+    main()
+
+
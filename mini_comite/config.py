@@ -2,6 +2,10 @@
 Configurações centralizadas do projeto.
 """
 
+import os
+from pathlib import Path
+from types import MappingProxyType
+
 # Capital inicial padrão para todas as simulações
 CAPITAL_INICIAL = 100_000.0
 
@@ -21,30 +25,39 @@ SPREAD_CDI_SELIC = -0.001   # CDI fica 0,1 p.p. abaixo da Selic (conforme B3)
 MESES_SIMULACAO = ANOS_SIMULACAO * MESES_POR_ANO        # 36 meses para 3 anos
 DIAS_UTEIS_SIMULACAO = ANOS_SIMULACAO * DIAS_UTEIS_POR_ANO  # 756 dias úteis para 3 anos
 
+# Raiz dos caches opcionais em disco (PLOT_CACHE/SCENARIO_CACHE): um diretório
+# próprio do projeto dentro de $XDG_CACHE_HOME (padrão ~/.cache)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mini-comite-politica-monetaria"
+
+# Produtos simulados (chaves das timelines) e nome da aba correspondente no Excel
+PRODUTOS = ("Tesouro_Prefixado", "Tesouro_IPCA_Plus", "Tesouro_Selic", "CDB_100_CDI", "LCI", "Poupanca")
+SHEET_NAMES = {p: p.replace("_", " ")[:31] for p in PRODUTOS}  # Excel limita a 31 caracteres
+
 # =============================================================================
 # CONFIGURAÇÕES DOS CENÁRIOS ECONÔMICOS
 # =============================================================================
 
-CENARIOS_CONFIG = {
+# Somente leitura: dicionários expostos via MappingProxyType e trajetórias como tuplas
+CENARIOS_CONFIG = MappingProxyType({name: MappingProxyType(cfg) for name, cfg in {
     "Manutencao": {
         "nome": "Cenario 1 - Manutencao",
         "descricao": f"Selic mantida em 15% a.a. e IPCA em 4,5% a.a. por {ANOS_SIMULACAO} anos",
-        "selic_por_ano": [0.15] * ANOS_SIMULACAO,  # 15% mantido por todos os anos
-        "ipca_por_ano": [0.045] * ANOS_SIMULACAO,  # 4,5% mantido por todos os anos
+        "selic_por_ano": (0.15,) * ANOS_SIMULACAO,  # 15% mantido por todos os anos
+        "ipca_por_ano": (0.045,) * ANOS_SIMULACAO,  # 4,5% mantido por todos os anos
     },
     
     "Aperto": {
         "nome": "Cenario 2 - Aperto",
         "descricao": "Aperto monetário: Selic sobe gradualmente; IPCA acelera",
-        "selic_por_ano": [0.15, 0.165, 0.17][:ANOS_SIMULACAO],  # Ajusta automaticamente
-        "ipca_por_ano": [0.045, 0.05, 0.055][:ANOS_SIMULACAO],  # Ajusta automaticamente
+        "selic_por_ano": (0.15, 0.165, 0.17)[:ANOS_SIMULACAO],  # Ajusta automaticamente
+        "ipca_por_ano": (0.045, 0.05, 0.055)[:ANOS_SIMULACAO],  # Ajusta automaticamente
     },
     
     "Afrouxamento": {
         "nome": "Cenario 3 - Afrouxamento",
         "descricao": "Afrouxamento monetário: Selic cai gradualmente; IPCA controlado",
-        "selic_por_ano": [0.15, 0.13, 0.11][:ANOS_SIMULACAO],  # Ajusta automaticamente
-        "ipca_por_ano": [0.04] * ANOS_SIMULACAO,  # 4% mantido por todos os anos
+        "selic_por_ano": (0.15, 0.13, 0.11)[:ANOS_SIMULACAO],  # Ajusta automaticamente
+        "ipca_por_ano": (0.04,) * ANOS_SIMULACAO,  # 4% mantido por todos os anos
     },
     
     # =============================================================================
@@ -54,21 +67,21 @@ CENARIOS_CONFIG = {
     # "Recessao": {
     #     "nome": "Cenario 4 - Recessao",
     #     "descricao": "Cenário recessivo: Selic muito baixa, IPCA controlado",
-    #     "selic_por_ano": [0.15, 0.08, 0.05][:ANOS_SIMULACAO],
-    #     "ipca_por_ano": [0.045, 0.02, 0.015][:ANOS_SIMULACAO],
+    #     "selic_por_ano": (0.15, 0.08, 0.05)[:ANOS_SIMULACAO],
+    #     "ipca_por_ano": (0.045, 0.02, 0.015)[:ANOS_SIMULACAO],
     # },
     
     # "Crise": {
     #     "nome": "Cenario 5 - Crise",
     #     "descricao": "Cenário de crise: Selic alta, IPCA descontrolado",
-    #     "selic_por_ano": [0.15, 0.25, 0.30][:ANOS_SIMULACAO],
-    #     "ipca_por_ano": [0.045, 0.12, 0.18][:ANOS_SIMULACAO],
+    #     "selic_por_ano": (0.15, 0.25, 0.30)[:ANOS_SIMULACAO],
+    #     "ipca_por_ano": (0.045, 0.12, 0.18)[:ANOS_SIMULACAO],
     # },
     
     # "Expansao": {
     #     "nome": "Cenario 6 - Expansao",
     #     "descricao": "Cenário expansivo: Selic baixa, crescimento econômico",
-    #     "selic_por_ano": [0.15, 0.10, 0.06][:ANOS_SIMULACAO],
-    #     "ipca_por_ano": [0.045, 0.035, 0.025][:ANOS_SIMULACAO],
+    #     "selic_por_ano": (0.15, 0.10, 0.06)[:ANOS_SIMULACAO],
+    #     "ipca_por_ano": (0.045, 0.035, 0.025)[:ANOS_SIMULACAO],
     # },
-}
+}.items()})
@@ -0,0 +1,1617 @@
+from __future__ import annotations
+
+import gc
+import math
+from functools import lru_cache
+from types import MappingProxyType
+import hashlib
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Union
+import numpy as np
+import pandas as pd
+
+import plotly
+import plotly.graph_objects as go
+import plotly.express as px
+from plotly.subplots import make_subplots
+import plotly.io as pio
+
+from .config import CACHE_DIR
+
+
+# Estilo comum das figuras, reaproveitado em todos os layouts
+_BASE_LAYOUT = MappingProxyType(dict(
+    plot_bgcolor='white',
+    paper_bgcolor='white',
+    font=dict(family="Arial, sans-serif", size=12)
+))
+_GRID = MappingProxyType(dict(gridcolor='lightgray', gridwidth=0.5))
+
+# Cor padrão para produtos/cenários sem cor definida
+_DEFAULT_COLOR = '#95A5A6'
+
+# Cores por produto (nome de exibição) nos gráficos individuais por cenário
+_INDIVIDUAL_COLORS = MappingProxyType({
+    'LCI': '#2E86AB',
+    'Tesouro Selic': '#A23B72',
+    'CDB 100% CDI': '#F18F01',
+    'Tesouro Prefixado': '#C73E1D',
+    'Tesouro IPCA+': '#6A994E',
+    'Poupanca': '#8E44AD'
+})
+
+# Cores por produto (chave da timeline) nos gráficos de evolução temporal
+_EVOLUTION_COLORS = MappingProxyType({
+    'Tesouro_Selic': '#2E86AB',
+    'CDB_100_CDI': '#F18F01',
+    'Tesouro_Prefixado': '#C73E1D',
+    'Tesouro_IPCA_Plus': '#6A994E',
+    'LCI': '#A23B72',
+    'Poupanca': '#8E44AD'
+})
+
+
+# Fator de escala dos PNGs em lote (variável de ambiente PLOT_SCALE, padrão 1):
+# escala 2 significa 4x mais pixels para o Kaleido renderizar e codificar
+PNG_SCALE = float(os.environ.get("PLOT_SCALE", "1"))
+# Exceção documentada no README: o gráfico de destaque (evolucao_comparativa.png)
+# sai sempre em escala >= 2, mesmo com o padrão 1
+_HERO_SCALE = max(2.0, PNG_SCALE)
+
+
+def _png_scale(fast: bool) -> float:
+    """Fator de escala do PNG: PNG_SCALE, limitado a 1 quando se prioriza velocidade.
+
+    Com o padrão (PLOT_SCALE=1) ``fast`` não muda nada; só faz diferença quando
+    PLOT_SCALE > 1, e nunca aumenta uma escala menor que 1.
+    """
+    return min(1.0, PNG_SCALE) if fast else PNG_SCALE
+
+
+# Destino de exportação: caminho no disco ou objeto arquivo (ex.: io.BytesIO)
+SaveTarget = Union[str, "os.PathLike[str]", BinaryIO]
+
+
+# Profundidade de aninhamento de _persistent_image_server
+_server_depth = 0
+
+
+@contextmanager
+def _persistent_image_server():
+    """Mantém um único processo do Kaleido (Chrome) aberto durante várias exportações.
+
+    Sem isso, cada ``pio.write_image`` abre e fecha um navegador próprio. Se o
+    Kaleido instalado não tiver servidor (versões < 1) ou o Chrome não for
+    encontrado, as exportações seguem no modo padrão.
+
+    O Chrome é procurado antes pelo choreographer (dependência declarada, usada
+    pelo próprio Kaleido): ``kaleido.start_sync_server`` não acusa a falta do
+    navegador a quem chama, só falha depois na thread do servidor.
+    """
+    try:
+        import kaleido
+        from choreographer.browsers.chromium import Chromium
+        start, stop = kaleido.start_sync_server, kaleido.stop_sync_server
+        available = bool(os.environ.get("BROWSER_PATH") or Chromium.find_browser(skip_local=False))
+    except (ImportError, AttributeError):
+        # Kaleido < 1 (sem servidor) ou API do choreographer diferente da esperada
+        available = False
+    
+    global _server_depth
+    if not available:
+        yield
+        return
+    
+    # Reentrante: só o bloco mais externo abre e fecha o servidor
+    if _server_depth == 0:
+        start(silence_warnings=True)
+    _server_depth += 1
+    try:
+        yield
+    finally:
+        _server_depth -= 1
+        if _server_depth == 0:
+            stop(silence_warnings=True)
+
+
+@lru_cache(maxsize=8)
+def _bdays(start: str, n: int) -> np.ndarray:
+    """Eixo de ``n`` dias úteis a partir de ``start`` como strings ISO 'AAAA-MM-DD'.
+
+    Memoizado: todos os produtos de um cenário compartilham o mesmo eixo. As
+    strings (array NumPy de largura fixa, somente leitura) serializam no JSON da
+    figura exatamente como os ``datetime.date`` de antes, sem array de objetos.
+    """
+    dates = np.datetime_as_string(pd.bdate_range(start=start, periods=n).to_numpy(), unit="D")
+    dates.flags.writeable = False
+    return dates
+
+
+# Capital de referência das rentabilidades exibidas nos gráficos
+_CAPITAL_REF = 100000
+
+
+def _rentabilidade_pct(valores: np.ndarray, capital: float = _CAPITAL_REF) -> np.ndarray:
+    """Rentabilidade acumulada (%) de valores sobre o capital: (v / capital - 1) * 100.
+
+    Núcleo vetorizado compartilhado pelos gráficos; opera no lugar sobre um único
+    array de saída (mesma sequência de operações, resultado idêntico bit a bit).
+    """
+    out = np.asarray(valores, dtype=np.float64) / capital
+    out -= 1
+    out *= 100
+    return out
+
+
+def _aliquota_efetiva(saldo_bruto: np.ndarray, provisao_ir: np.ndarray) -> np.ndarray:
+    """Alíquota efetiva de IR (fração) sobre o ganho acumulado; ganho nulo divide por 1, NaN vira 0.
+
+    Divide no lugar sobre uma cópia da provisão (onde o ganho é nulo ela fica como
+    está, o mesmo que dividir por 1), sem os arrays temporários de ``np.where``.
+    """
+    ganho = saldo_bruto - saldo_bruto[0]
+    aliquota = np.array(provisao_ir, dtype=np.float64)
+    np.divide(aliquota, ganho, out=aliquota, where=ganho != 0)  # Evitar divisão por zero
+    np.copyto(aliquota, 0.0, where=np.isnan(aliquota))
+    return aliquota
+
+
+def _timeline_column(data: dict, produto_key: str, col: str) -> np.ndarray:
+    """Coluna da timeline de um produto como ndarray.
+
+    Usa os arrays guardados pela simulação (``data["arrays"]``) quando existem,
+    sem passar pela indexação do pandas; senão lê da DataFrame da timeline.
+    """
+    arrays = data.get("arrays", {}).get(produto_key)
+    if arrays is not None:
+        return arrays[col]
+    return data["timelines"][produto_key][col].to_numpy()
+
+
+def _decimation_index(n_points: int, width_px: int):
+    """Índices para amostrar uma série em passo fixo, com no máximo ~2 pontos por pixel.
+
+    Séries curtas devolvem ``slice(None)`` (sem cópia); o último ponto é sempre mantido.
+    """
+    max_pts = 2 * width_px
+    if n_points <= max_pts:
+        return slice(None)
+    step = n_points // max_pts
+    idx = np.arange(0, n_points, step)
+    if idx[-1] != n_points - 1:
+        idx = np.append(idx, n_points - 1)
+    return idx
+
+
+# Cache de exportações opcional (PLOT_CACHE=1), fora da pasta de saída, em
+# CACHE_DIR/plots. Altere a versão para invalidar os arquivos já gravados
+_EXPORT_CACHE_VERSION = "export-v2"
+_EXPORT_CACHE_DIR = CACHE_DIR / "plots"
+
+
+def _export_cache_enabled() -> bool:
+    """Cache de exportações ligado pela variável de ambiente PLOT_CACHE=1."""
+    return os.environ.get("PLOT_CACHE") == "1"
+
+
+@lru_cache(maxsize=1)
+def _renderer_version() -> str:
+    """Versão do Kaleido instalado (o renderizador dos PNGs), para a chave do cache."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+        return version("kaleido")
+    except PackageNotFoundError:
+        return "none"
+
+
+def _cached_export_path(target: str, spec: dict, *opts) -> Optional[Path]:
+    """Caminho no cache para a exportação de ``spec`` (dict da figura) em ``target``.
+
+    None quando o cache está desligado (padrão; liga com PLOT_CACHE=1). A chave
+    BLAKE2b cobre a especificação JSON completa da figura, as opções de exportação
+    e as versões do cache, do Plotly e do Kaleido; o sufixo segue o do destino.
+    """
+    if not _export_cache_enabled():
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_EXPORT_CACHE_VERSION}|{plotly.__version__}|{_renderer_version()}|{opts!r}|".encode("utf-8"))
+    h.update(pio.to_json(spec, validate=False).encode("utf-8"))
+    return _EXPORT_CACHE_DIR / f"{h.hexdigest()}{Path(target).suffix}"
+
+
+def _store_in_cache(target: str, cached: Optional[Path]) -> None:
+    """Copia uma exportação recém-gravada para o cache (se ligado)."""
+    if cached is None:
+        return
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(target, cached)
+    except OSError:
+        # Cache é só otimização: falha de escrita não interrompe a exportação
+        pass
+
+
+# Exportações adiadas por _deferred_exports: (figura em dict, caminho, width, height, scale, cache)
+_pending_exports: Optional[list] = None
+
+
+@contextmanager
+def _deferred_exports():
+    """Acumula as exportações para disco feitas dentro do bloco e as grava num só lote.
+
+    As funções de plotagem seguem montando as figuras no thread principal; a
+    renderização fica para a saída do bloco, quando o Kaleido processa todas
+    as figuras juntas (em paralelo, com Kaleido >= 1). Os arquivos só existem
+    depois que o bloco mais externo termina; se alguma figura falhar, a saída
+    do bloco levanta RuntimeError com os caminhos não gravados.
+    """
+    global _pending_exports
+    if _pending_exports is not None:
+        # Já dentro de um bloco: o mais externo grava o lote
+        yield
+        return
+    
+    _pending_exports = []
+    try:
+        yield
+        pending = _pending_exports
+    finally:
+        _pending_exports = None
+    
+    if pending:
+        _flush_exports(pending)
+
+
+def _flush_exports(pending: list) -> None:
+    """Grava o lote adiado; se o lote falhar, tenta figura a figura e relata as falhas."""
+    figs, paths, widths, heights, scales, cached = map(list, zip(*pending))
+    try:
+        _write_images(figs, paths, width=widths, height=heights, scale=scales)
+        falhas = []
+    except Exception:
+        # Uma figura com problema não derruba as demais: grava uma a uma
+        falhas = []
+        for spec, path, width, height, scale, _ in pending:
+            try:
+                pio.write_image(spec, path, width=width, height=height, scale=scale, validate=False)
+            except Exception as exc:
+                falhas.append((path, exc))
+    
+    nao_gravados = {path for path, _ in falhas}
+    for path, cached_path in zip(paths, cached):
+        if path not in nao_gravados:
+            _store_in_cache(path, cached_path)
+    if falhas:
+        lista = "\n".join(f"  {path}" for path, _ in falhas)
+        raise RuntimeError(f"Falha ao exportar {len(falhas)} de {len(paths)} figura(s):\n{lista}") from falhas[0][1]
+
+
+def _export(fig: go.Figure, target: SaveTarget, width: int, height: int, scale: float = PNG_SCALE) -> None:
+    """Ponto único de exportação de imagens das funções de plotagem.
+
+    Dentro de ``_persistent_image_server`` (aberto por generate_all_plots) a
+    renderização reaproveita o navegador já aberto do Kaleido; dentro de
+    ``_deferred_exports`` os caminhos em disco entram no lote adiado. Figuras
+    idênticas já exportadas antes são copiadas do cache (PLOT_CACHE=1).
+    """
+    if not isinstance(target, (str, os.PathLike)):
+        # Objeto arquivo (ex.: io.BytesIO): gravado na hora, sem cache nem lote
+        pio.write_image(fig, target, width=width, height=height, scale=scale)
+        return
+    target = os.fspath(target)
+    
+    # Retrato da figura agora: quem chamou pode alterá-la depois
+    spec = fig.to_dict()
+    cached = _cached_export_path(target, spec, width, height, scale)
+    if cached is not None and cached.is_file():
+        shutil.copyfile(cached, target)
+        return
+    
+    if _pending_exports is not None:
+        _pending_exports.append((spec, target, width, height, scale, cached))
+        return
+    
+    pio.write_image(spec, target, width=width, height=height, scale=scale, validate=False)
+    _store_in_cache(target, cached)
+
+
+# Opções do HTML: plotly.js referenciado pelo CDN em vez de embutido (~3 MB a menos por arquivo)
+_HTML_OPTS = MappingProxyType(dict(include_plotlyjs='cdn', full_html=True, config={'responsive': True}))
+
+
+def _export_html(fig: go.Figure, target: str) -> None:
+    """Grava a figura como página HTML, reaproveitando o cache de exportações (se ligado)."""
+    if not _export_cache_enabled():
+        pio.write_html(fig, target, **_HTML_OPTS)
+        return
+    cached = _cached_export_path(target, fig.to_dict(), "html", dict(_HTML_OPTS))
+    if cached.is_file():
+        shutil.copyfile(cached, target)
+        return
+    pio.write_html(fig, target, **_HTML_OPTS)
+    _store_in_cache(target, cached)
+
+
+def _write_images(figs: list, paths: list, **opts) -> None:
+    """Exporta várias figuras numa única chamada ao Kaleido.
+
+    Com Kaleido >= 1 e ``pio.write_images`` disponível, o lote é renderizado
+    em paralelo (várias abas do mesmo navegador); caso contrário, uma a uma.
+    Cada opção (width, height, scale) pode ser um valor único ou uma lista por figura.
+    """
+    if not figs:
+        return
+    try:
+        import kaleido
+        batch = hasattr(pio, "write_images") and hasattr(kaleido, "write_fig_from_object_sync")
+    except ImportError:
+        batch = False
+    
+    if batch:
+        pio.write_images(figs, paths, validate=False, **opts)
+    else:
+        for i, (fig, path) in enumerate(zip(figs, paths)):
+            # Opções podem vir por figura (listas) ou valer para todo o lote
+            fig_opts = {k: v[i] if isinstance(v, list) else v for k, v in opts.items()}
+            pio.write_image(fig, path, validate=False, **fig_opts)
+
+
+def _embed_payload(fig: go.Figure, fmt: str, width: int, height: int) -> str:
+    """Serializa a figura para embutir em HTML, sem gerar PNG.
+
+    - "svg": marcação SVG renderizada pelo Kaleido (sem compressão raster);
+    - "html": fragmento <div> do Plotly (sem navegador; plotly.js via CDN).
+    """
+    if fmt == "svg":
+        return pio.to_image(fig, format="svg", width=width, height=height).decode("utf-8")
+    if fmt == "html":
+        return pio.to_html(fig, full_html=False, include_plotlyjs="cdn", default_width=width, default_height=height)
+    raise ValueError(f"Formato de embed desconhecido: {fmt!r} (use 'png', 'svg' ou 'html')")
+
+
+def _by_vf(df_summary, ascending: bool):
+    """Resumo ordenado por VF líquido, sem reordenar o que já vem ordenado.
+
+    Os resumos de simulate.py já saem em ordem decrescente: nesse caso basta
+    devolver a própria DataFrame ou a visão invertida (``iloc[::-1]``). Fora
+    disso, a ordem vem de um argsort NumPy sobre a coluna (NaN por último, como
+    no sort_values), sem a maquinaria geral de ordenação do pandas.
+    """
+    vf = df_summary["vf_liquido"]
+    if vf.is_monotonic_increasing:
+        return df_summary if ascending else df_summary.iloc[::-1]
+    if vf.is_monotonic_decreasing:
+        return df_summary.iloc[::-1] if ascending else df_summary
+    valores = vf.to_numpy(dtype=np.float64)
+    ordem = np.argsort(valores if ascending else -valores, kind="stable")
+    return df_summary.iloc[ordem]
+
+
+def _summary_bar_values(df_summary):
+    """Retorna (produtos, vf_liquido) em ordem crescente de VF líquido."""
+    # Ordena só as duas colunas usadas (argsort 1D), sem reindexar a DataFrame
+    # inteira; resumos já ordenados (o caso de simulate.py) só são invertidos
+    valores = df_summary["vf_liquido"].to_numpy()
+    produtos = df_summary["produto"].to_numpy()
+    passos = np.diff(valores)
+    if (passos >= 0).all():
+        return produtos.tolist(), valores
+    if (passos <= 0).all():
+        return produtos[::-1].tolist(), valores[::-1]
+    order = np.argsort(valores, kind="stable")
+    return produtos[order].tolist(), valores[order]
+
+
+def _summary_bar_trace(df_summary) -> go.Bar:
+    """Monta o traço de barras horizontais de VF líquido, sem criar figura."""
+    produtos, valores = _summary_bar_values(df_summary)
+    return _bar_trace(produtos, valores)
+
+
+def _bar_trace(produtos, valores) -> go.Bar:
+    """Traço de barras de plot_summary_bar a partir de produtos e valores ordenados."""
+    return go.Bar(
+        y=produtos,
+        x=valores,
+        orientation='h',
+        marker_color='#4C78A8',
+        # Rótulos formatados pelo próprio Plotly a partir de x (sem laço Python por barra)
+        texttemplate='R$ %{x:,.0f}',
+        textposition='outside',
+        textfont=dict(size=11),
+        hovertemplate='<b>%{y}</b><br>VF Líquido: R$ %{x:,.2f}<extra></extra>'
+    )
+
+
+def _figure_key(df_summary) -> tuple:
+    """Chave imutável (produtos, vf_liquido) de um resumo, em ordem crescente de VF."""
+    produtos, valores = _summary_bar_values(df_summary)
+    return tuple(produtos), tuple(valores.tolist())
+
+
+@lru_cache(maxsize=32)
+def _summary_bar_json(title: str, produtos: tuple, valores: tuple) -> str:
+    """JSON da figura de plot_summary_bar para um resumo já visto.
+
+    Guarda o JSON e não o objeto: figuras Plotly são mutáveis, e cada chamada
+    precisa de uma cópia própria. Os dados entram como listas para que a figura
+    reidratada tenha valores comuns (e não typed arrays codificados).
+    """
+    layout = dict(
+        title={
+            'text': title,
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#2E86AB'}
+        },
+        xaxis_title="VF Líquido (R$)",
+        yaxis_title="Produto",
+        height=400,
+        width=800,
+        margin=dict(l=20, r=80, t=60, b=50),
+        **_BASE_LAYOUT,
+        xaxis=dict(
+            tickformat=',.0f',
+            **_GRID
+        ),
+        yaxis=dict(
+            tickfont=dict(size=11)
+        )
+    )
+    
+    return go.Figure(data=[_bar_trace(list(produtos), list(valores))], layout=layout).to_json()
+
+
+def plot_summary_bar(df_summary, title: str = "Resumo por Produto", save_path: Optional[SaveTarget] = None, show: bool = False, fast: bool = False, fmt: str = "png") -> Union[go.Figure, str]:
+    """Plota barras com VF líquido por produto (DataFrame produzido em simulate.py).
+
+    Espera colunas: 'produto', 'vf_liquido'.
+    Com ``fast=True`` o PNG é exportado em escala min(1, PLOT_SCALE) (pré-visualização rápida).
+    ``save_path`` aceita também um objeto arquivo (ex.: io.BytesIO), sem passar pelo disco.
+    Com ``fmt="svg"`` ou ``"html"`` e sem ``save_path``, retorna a string para embutir em HTML.
+    """
+    # Criar gráfico de barras horizontais; resumos repetidos (mesmo título,
+    # produtos e valores) reaproveitam o JSON memoizado em _summary_bar_json
+    fig = go.Figure(json.loads(_summary_bar_json(title, *_figure_key(df_summary))))
+    
+    if fmt != "png" and not save_path:
+        return _embed_payload(fig, fmt, width=800, height=400)
+    
+    if save_path:
+        _export(fig, save_path, width=800, height=400, scale=_png_scale(fast))
+    
+    if show:
+        fig.show()
+    
+    return fig
+
+
+def plot_timeline(product_result: dict, title: str = "Evolução Temporal", save_path: Optional[SaveTarget] = None, show: bool = False, fast: bool = False, fmt: str = "png") -> Union[go.Figure, str]:
+    """Plota a evolução temporal do saldo para um produto (saída de products.py).
+
+    Usa as colunas 'saldo_bruto', 'provisao_ir' e 'saldo_liquido_estimado' da timeline.
+    Com ``fast=True`` o PNG é exportado em escala min(1, PLOT_SCALE) (pré-visualização rápida).
+    ``save_path`` aceita também um objeto arquivo (ex.: io.BytesIO), sem passar pelo disco.
+    Com ``fmt="svg"`` ou ``"html"`` e sem ``save_path``, retorna a string para embutir em HTML.
+    """
+    df = product_result["timeline"]
+    produto_nome = product_result["produto"]
+    
+    # Colunas convertidas uma única vez para ndarray (evita a conversão por traço);
+    # séries mais longas que ~2 pontos por pixel são amostradas antes de plotar
+    idx = _decimation_index(len(df), width_px=900)
+    periodo = df["periodo"].to_numpy()[idx]
+    
+    traces = [
+        # Linha do saldo bruto
+        go.Scatter(
+            x=periodo,
+            y=df["saldo_bruto"].to_numpy()[idx],
+            mode='lines',
+            name='Saldo Bruto',
+            line=dict(color='#2E86AB', width=2),
+            hovertemplate='<b>Saldo Bruto</b><br>Período: %{x}<br>Valor: R$ %{y:,.2f}<extra></extra>'
+        ),
+        # Linha do saldo líquido estimado
+        go.Scatter(
+            x=periodo,
+            y=df["saldo_liquido_estimado"].to_numpy()[idx],
+            mode='lines',
+            name='Saldo Líquido',
+            line=dict(color='#A23B72', width=2),
+            hovertemplate='<b>Saldo Líquido</b><br>Período: %{x}<br>Valor: R$ %{y:,.2f}<extra></extra>'
+        ),
+        # Área da provisão de IR
+        go.Scatter(
+            x=periodo,
+            y=df["provisao_ir"].to_numpy()[idx],
+            mode='lines',
+            name='Provisão IR',
+            line=dict(color='#F18F01', width=1),
+            fill='tozeroy',
+            fillcolor='rgba(241, 143, 1, 0.2)',
+            hovertemplate='<b>Provisão IR</b><br>Período: %{x}<br>Valor: R$ %{y:,.2f}<extra></extra>'
+        ),
+    ]
+    
+    layout = dict(
+        title={
+            'text': f"{title} - {produto_nome}",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#2E86AB'}
+        },
+        xaxis_title="Período (dias úteis)",
+        yaxis_title="Valor (R$)",
+        height=500,
+        width=900,
+        margin=dict(l=50, r=50, t=80, b=50),
+        **_BASE_LAYOUT,
+        xaxis=dict(
+            **_GRID,
+            showline=True,
+            linecolor='gray'
+        ),
+        yaxis=dict(
+            tickformat=',.0f',
+            **_GRID,
+            showline=True,
+            linecolor='gray'
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        hovermode='x unified'
+    )
+    
+    # Figura construída de uma vez com todos os traços e o layout
+    fig = go.Figure(data=traces, layout=layout)
+    
+    if fmt != "png" and not save_path:
+        return _embed_payload(fig, fmt, width=900, height=500)
+    
+    if save_path:
+        _export(fig, save_path, width=900, height=500, scale=_png_scale(fast))
+    
+    if show:
+        fig.show()
+    
+    return fig
+
+
+def plot_all_scenarios_summary(results_by_scenario: Dict[str, object], save_dir: Optional[str] = None, show: bool = False, sinks: Optional[Dict[str, BinaryIO]] = None, tiled: bool = False, fmt: str = "png") -> Union[go.Figure, Dict[str, str], None]:
+    """Recebe o dicionário {nome_cenário: df_resumo} e plota um gráfico por cenário.
+
+    - save_dir: se informado, salva cada figura como PNG dentro do diretório.
+    - sinks: alternativa em memória a save_dir, {nome_cenário: buffer}; cada PNG
+      é escrito no buffer do cenário (cenários ausentes recorrem a save_dir).
+    - tiled: desenha todos os cenários como subplots de uma única figura e
+      exporta um só PNG ('resumo_cenarios_summary.png'); retorna essa figura.
+    - fmt: "svg" ou "html" retorna {nome_cenário: string} para embutir em
+      relatórios, sem gravar PNGs (save_dir e sinks são ignorados).
+
+    Chamada diretamente, os PNGs de save_dir já estão gravados quando a função
+    retorna (o lote é gravado na saída do bloco, antes do return). Dentro de
+    outro ``_deferred_exports`` (ex.: generate_all_plots) eles entram no lote
+    do bloco externo e só existem quando ele termina; por isso generate_all_plots
+    só imprime o relatório depois disso.
+    """
+    if fmt != "png":
+        return {
+            scen_name: plot_summary_bar(df_summary, title=f"{scen_name} — VF Líquido por Produto", fmt=fmt)
+            for scen_name, df_summary in results_by_scenario.items()
+        }
+    
+    if tiled:
+        return _plot_all_scenarios_summary_tiled(results_by_scenario, save_dir=save_dir, show=show)
+    
+    # Sem destino nem exibição as figuras seriam descartadas: nada a construir
+    if not show and not save_dir and not sinks:
+        return None
+    
+    # A primeira figura é reaproveitada: nos cenários seguintes só os dados e o
+    # título são trocados, sem reconstruir e revalidar layout e traço. Os PNGs
+    # destinados ao disco são exportados num único lote ao final do bloco (ou do
+    # bloco externo, se houver um aberto).
+    fig = None
+    with _deferred_exports():
+        for scen_name, df_summary in results_by_scenario.items():
+            title = f"{scen_name} — VF Líquido por Produto"
+            if sinks is not None and scen_name in sinks:
+                path = sinks[scen_name]
+            else:
+                path = f"{save_dir}/{scen_name.replace(' ', '_').lower()}_summary.png" if save_dir else None
+            
+            if fig is None:
+                fig = plot_summary_bar(df_summary, title=title)
+            else:
+                produtos, valores = _summary_bar_values(df_summary)
+                with fig.batch_update():
+                    fig.data[0].y = produtos
+                    fig.data[0].x = valores
+                    fig.layout.title.text = title
+            
+            if path is not None:
+                _export(fig, path, width=800, height=400, scale=PNG_SCALE)
+            
+            if show:
+                fig.show()
+    
+    # Figuras Plotly formam ciclos de referência (figura <-> traços); libera
+    # a memória já aqui em vez de esperar o próximo ciclo do coletor
+    del fig
+    gc.collect()
+    return None
+
+
+def _plot_all_scenarios_summary_tiled(results_by_scenario: Dict[str, object], save_dir: Optional[str] = None, show: bool = False) -> go.Figure:
+    """Versão em grade de plot_all_scenarios_summary: uma figura, uma exportação."""
+    n = len(results_by_scenario)
+    ncols = max(1, math.ceil(math.sqrt(n)))
+    nrows = max(1, math.ceil(n / ncols))
+    
+    fig = make_subplots(
+        rows=nrows, cols=ncols,
+        subplot_titles=list(results_by_scenario.keys()),
+        horizontal_spacing=0.18,
+        vertical_spacing=0.15
+    )
+    
+    # Subplots sem cenário correspondente ficam vazios
+    for i, df_summary in enumerate(results_by_scenario.values()):
+        fig.add_trace(_summary_bar_trace(df_summary), row=i // ncols + 1, col=i % ncols + 1)
+    
+    width, height = 800 * ncols, 400 * nrows
+    fig.update_layout(
+        title={
+            'text': "VF Líquido por Produto — Todos os Cenários",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#2E86AB'}
+        },
+        showlegend=False,
+        height=height,
+        width=width,
+        margin=dict(l=20, r=80, t=80, b=50),
+        **_BASE_LAYOUT
+    )
+    fig.update_xaxes(tickformat=',.0f', **_GRID)
+    fig.update_yaxes(tickfont=dict(size=11))
+    
+    if save_dir:
+        _export(fig, f"{save_dir}/resumo_cenarios_summary.png", width=width, height=height, scale=PNG_SCALE)
+    
+    if show:
+        fig.show()
+    
+    return fig
+
+
+def plot_comparison_all_scenarios(results_by_scenario: Dict[str, object], save_path: Optional[str] = None, show: bool = False) -> go.Figure:
+    """Cria gráfico comparativo de todos os cenários em uma única visualização."""
+    
+    fig = go.Figure()
+    traces = []
+    
+    # Cores para cada cenário
+    colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#6A994E', '#8E44AD']
+    
+    for i, (scen_name, df_summary) in enumerate(results_by_scenario.items()):
+        df_plot = _by_vf(df_summary, ascending=False)
+        
+        traces.append(go.Bar(
+            name=scen_name,
+            x=df_plot["produto"],
+            y=df_plot["vf_liquido"],
+            marker_color=colors[i % len(colors)],
+            texttemplate='R$ %{y:,.0f}',
+            textposition='outside',
+            textfont=dict(size=10),
+            hovertemplate=f'<b>{scen_name}</b><br>%{{x}}<br>VF Líquido: R$ %{{y:,.2f}}<extra></extra>'
+        ))
+    
+    fig.add_traces(traces)
+    
+    fig.update_layout(
+        title={
+            'text': "Comparação de VF Líquido por Cenário",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18, 'color': '#2E86AB'}
+        },
+        xaxis_title="Produtos",
+        yaxis_title="VF Líquido (R$)",
+        barmode='group',
+        height=600,
+        width=1000,
+        margin=dict(l=50, r=50, t=80, b=100),
+        **_BASE_LAYOUT,
+        xaxis=dict(
+            tickangle=45,
+            **_GRID
+        ),
+        yaxis=dict(
+            tickformat=',.0f',
+            **_GRID
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.2,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    
+    if save_path:
+        _export(fig, save_path, width=1000, height=600, scale=PNG_SCALE)
+    
+    if show:
+        fig.show()
+    
+    return fig
+
+
+def plot_ir_evolution(product_result: dict, save_path: Optional[str] = None, show: bool = False) -> go.Figure:
+    """Plota a evolução da alíquota de IR ao longo do tempo."""
+    
+    df = product_result["timeline"]
+    produto_nome = product_result["produto"]
+    
+    # Calcular alíquota efetiva de IR em percentual (ndarray, sem Series intermediárias)
+    aliquota_pct = _aliquota_efetiva(df["saldo_bruto"].to_numpy(), df["provisao_ir"].to_numpy())
+    aliquota_pct *= 100
+    
+    fig = go.Figure()
+    
+    # Linha da alíquota de IR
+    fig.add_trace(go.Scatter(
+        x=df["periodo"].to_numpy(),
+        y=aliquota_pct,
+        mode='lines',
+        name='Alíquota IR Efetiva',
+        line=dict(color='#C73E1D', width=2),
+        hovertemplate='<b>Alíquota IR</b><br>Período: %{x}<br>Taxa: %{y:.1f}%<extra></extra>'
+    ))
+    
+    # Adicionar linhas de referência das faixas de IR
+    faixas_ir = [
+        (0, 180, 22.5, "22,5% (0-180 dias)"),
+        (181, 360, 20.0, "20% (181-360 dias)"),
+        (361, 720, 17.5, "17,5% (361-720 dias)"),
+        (721, len(df), 15.0, "15% (721+ dias)")
+    ]
+    
+    # Linhas horizontais e rótulos montados de uma vez e passados no update_layout
+    # abaixo (equivalente a add_hline(..., annotation_position="bottom right"),
+    # sem revalidar o layout a cada faixa)
+    faixas_visiveis = [(taxa, nome) for inicio, fim, taxa, nome in faixas_ir if inicio < len(df)]
+    shapes = [
+        dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=taxa, y1=taxa,
+             line=dict(color='gray', dash='dash'))
+        for taxa, _ in faixas_visiveis
+    ]
+    annotations = [
+        dict(text=nome, showarrow=False, xref='x domain', x=1, xanchor='right',
+             yref='y', y=taxa, yanchor='top')
+        for taxa, nome in faixas_visiveis
+    ]
+    
+    fig.update_layout(
+        shapes=shapes,
+        annotations=annotations,
+        title={
+            'text': f"Evolução da Alíquota de IR - {produto_nome}",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#2E86AB'}
+        },
+        xaxis_title="Período (dias úteis)",
+        yaxis_title="Alíquota IR (%)",
+        height=400,
+        width=800,
+        margin=dict(l=50, r=50, t=80, b=50),
+        **_BASE_LAYOUT,
+        xaxis=dict(
+            **_GRID
+        ),
+        yaxis=dict(
+            **_GRID,
+            range=[0, 25]  # 0% a 25%
+        )
+    )
+    
+    if save_path:
+        _export(fig, save_path, width=800, height=400, scale=PNG_SCALE)
+    
+    if show:
+        fig.show()
+    
+    return fig
+
+
+@lru_cache(maxsize=32)
+def _scenario_individual_json(scenario_name: str, produtos: tuple, valores: tuple) -> str:
+    """JSON da figura de plot_scenario_individual, memoizado como em _summary_bar_json."""
+    
+    vf = np.array(valores)
+    
+    # Mapear cores aos produtos (nomes fora do mapa recebem a cor padrão)
+    bar_colors = [_INDIVIDUAL_COLORS.get(produto, _DEFAULT_COLOR) for produto in produtos]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        y=list(produtos),
+        x=list(valores),
+        orientation='h',
+        marker_color=bar_colors,
+        texttemplate='R$ %{x:,.0f}',
+        textposition='outside',
+        textfont=dict(size=12, color='black'),
+        hovertemplate='<b>%{y}</b><br>VF Líquido: R$ %{x:,.2f}<br>Rentabilidade: %{customdata:.1f}%<extra></extra>',
+        customdata=_rentabilidade_pct(vf).tolist()  # Assumindo capital inicial de 100k
+    ))
+    
+    # Adicionar linha de referência do capital inicial
+    fig.add_vline(
+        x=100000,
+        line_dash="dash",
+        line_color="gray",
+        annotation_text="Capital Inicial",
+        annotation_position="top"
+    )
+    
+    fig.update_layout(
+        title={
+            'text': f"{scenario_name}<br><span style='font-size:14px'>Valor Futuro Líquido por Produto</span>",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18, 'color': '#2E86AB'}
+        },
+        xaxis_title="Valor Futuro Líquido (R$)",
+        yaxis_title="Produtos de Investimento",
+        height=500,
+        width=900,
+        margin=dict(l=150, r=100, t=100, b=60),
+        **_BASE_LAYOUT,
+        xaxis=dict(
+            tickformat=',.0f',
+            **_GRID,
+            showline=True,
+            linecolor='gray',
+            range=[95000, vf.max() * 1.1]
+        ),
+        yaxis=dict(
+            tickfont=dict(size=12),
+            showline=True,
+            linecolor='gray'
+        ),
+        showlegend=False
+    )
+    
+    # Adicionar anotações com rentabilidade (calculadas de uma vez sobre o ndarray,
+    # acrescentadas às já existentes numa única alteração do layout)
+    rentabilidades = _rentabilidade_pct(vf)
+    fig.update_layout(annotations=[*fig.layout.annotations, *(
+        dict(
+            x=x,
+            y=i,
+            text=f"{rentabilidade:+.1f}%",
+            showarrow=False,
+            font=dict(size=10, color='#666666'),
+            xanchor='left'
+        )
+        for i, (x, rentabilidade) in enumerate(zip((vf + 2000).tolist(), rentabilidades.tolist()))
+    )])
+    
+    return fig.to_json()
+
+
+def plot_scenario_individual(scenario_name: str, df_summary, save_path: Optional[str] = None, show: bool = False) -> go.Figure:
+    """Cria gráfico individual para um cenário específico com todos os títulos."""
+    
+    fig = go.Figure(json.loads(_scenario_individual_json(scenario_name, *_figure_key(df_summary))))
+    
+    if save_path:
+        _export(fig, save_path, width=900, height=500, scale=PNG_SCALE)
+    
+    if show:
+        fig.show()
+    
+    return fig
+
+
+def plot_evolution_by_scenario(results_data: Dict[str, Dict], save_dir: Optional[str] = None, show: bool = False) -> list[go.Figure]:
+    """Cria gráficos de evolução temporal para cada cenário."""
+    
+    figures = []
+    
+    for scenario_name, data in results_data.items():
+        # Nome limpo para arquivo
+        clean_name = scenario_name.replace(' ', '_').replace('-', '').lower()
+        save_path = f"{save_dir}/{clean_name}_evolucao.png" if save_dir else None
+        
+        fig = go.Figure()
+        traces = []
+        
+        # Plotar evolução de cada produto
+        timelines = data.get("timelines", {})
+        
+        for produto_key, timeline_df in timelines.items():
+            if len(timeline_df) > 0:
+                # Nome limpo do produto para exibição
+                produto_display = format_product_name(produto_key)
+                color = _EVOLUTION_COLORS.get(produto_key, _DEFAULT_COLOR)
+                
+                # Criar datas baseadas no período (iniciando em 2025-01-01)
+                dates = _bdays("2025-01-01", len(timeline_df))
+                
+                # Linha do saldo líquido estimado
+                traces.append(go.Scatter(
+                    x=dates,
+                    y=_timeline_column(data, produto_key, "saldo_liquido_estimado"),
+                    mode='lines',
+                    name=produto_display,
+                    line=dict(color=color, width=2),
+                    hovertemplate=f'<b>{produto_display}</b><br>Data: %{{x}}<br>Saldo Líquido: R$ %{{y:,.2f}}<extra></extra>'
+                ))
+        
+        fig.add_traces(traces)
+        
+        # Adicionar linha de referência do capital inicial
+        if len(timelines) > 0:
+            fig.add_hline(
+                y=100000,
+                line_dash="dash",
+                line_color="gray",
+                annotation_text="Capital Inicial (R$ 100.000)",
+                annotation_position="bottom right"
+            )
+        
+        fig.update_layout(
+            title={
+                'text': f"Evolução Temporal - {scenario_name}<br><span style='font-size:14px'>Saldo Líquido ao Longo do Tempo</span>",
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#2E86AB'}
+            },
+            xaxis_title="Data",
+            yaxis_title="Saldo Líquido (R$)",
+            height=600,
+            width=1000,
+            margin=dict(l=60, r=60, t=100, b=80),
+            **_BASE_LAYOUT,
+            xaxis=dict(
+                **_GRID,
+                showline=True,
+                linecolor='gray',
+                tickformat='%d/%m/%Y',
+                dtick='M3',  # Mostrar marcas a cada 3 meses
+                tickangle=45  # Rotacionar datas em 45 graus
+            ),
+            yaxis=dict(
+                tickformat=',.0f',
+                **_GRID,
+                showline=True,
+                linecolor='gray'
+            ),
+            legend=dict(
+                orientation="v",
+                yanchor="top",
+                y=0.98,
+                xanchor="left",
+                x=1.02,
+                bgcolor="rgba(255,255,255,0.8)",
+                bordercolor="lightgray",
+                borderwidth=1
+            ),
+            hovermode='x unified'
+        )
+        
+        if save_path:
+            _export(fig, save_path, width=1000, height=600, scale=PNG_SCALE)
+        
+        if show:
+            fig.show()
+        
+        figures.append(fig)
+    
+    return figures
+
+
+def plot_evolution_comparison(results_data: Dict[str, Dict], save_path: Optional[str] = None, show: bool = False) -> go.Figure:
+    """Cria gráfico comparativo da evolução de um produto em todos os cenários."""
+    
+    fig = go.Figure()
+    traces = []
+    
+    # Cores para cenários
+    scenario_colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#6A994E', '#8E44AD']
+    
+    # Escolher um produto para comparação (ex: Tesouro Selic)
+    produto_referencia = "Tesouro_Selic"
+    
+    for i, (scenario_name, data) in enumerate(results_data.items()):
+        timelines = data.get("timelines", {})
+        
+        if produto_referencia in timelines:
+            timeline_df = timelines[produto_referencia]
+            color = scenario_colors[i % len(scenario_colors)]
+            
+            # Criar datas baseadas no período (iniciando em 2025-01-01)
+            dates = _bdays("2025-01-01", len(timeline_df))
+            
+            traces.append(go.Scatter(
+                x=dates,
+                y=_timeline_column(data, produto_referencia, "saldo_liquido_estimado"),
+                mode='lines',
+                name=scenario_name,
+                line=dict(color=color, width=2),
+                hovertemplate=f'<b>{scenario_name}</b><br>Data: %{{x}}<br>Saldo Líquido: R$ %{{y:,.2f}}<extra></extra>'
+            ))
+    
+    fig.add_traces(traces)
+    
+    # Linha de referência do capital inicial
+    if results_data:
+        fig.add_hline(
+            y=100000,
+            line_dash="dash",
+            line_color="gray",
+            annotation_text="Capital Inicial (R$ 100.000)",
+            annotation_position="bottom right"
+        )
+    
+    fig.update_layout(
+        title={
+            'text': f"Comparação de Evolução - Tesouro Selic<br><span style='font-size:14px'>Todos os Cenários Econômicos</span>",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18, 'color': '#2E86AB'}
+        },
+        xaxis_title="Data",
+        yaxis_title="Saldo Líquido (R$)",
+        height=600,
+        width=1000,
+        margin=dict(l=60, r=60, t=100, b=80),
+        **_BASE_LAYOUT,
+        xaxis=dict(
+            **_GRID,
+            showline=True,
+            linecolor='gray',
+            tickformat='%d/%m/%Y',
+            dtick='M3',  # Mostrar marcas a cada 3 meses
+            tickangle=45  # Rotacionar datas em 45 graus
+        ),
+        yaxis=dict(
+            tickformat=',.0f',
+            **_GRID,
+            showline=True,
+            linecolor='gray'
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.15,
+            xanchor="center",
+            x=0.5
+        ),
+        hovermode='x unified'
+    )
+    
+    if save_path:
+        _export(fig, save_path, width=1000, height=600, scale=_HERO_SCALE)
+    
+    if show:
+        fig.show()
+    
+    return fig
+
+
+def plot_all_scenarios_individual(results_by_scenario: Dict[str, object], save_dir: Optional[str] = None, show: bool = False) -> list[go.Figure]:
+    """Cria um gráfico individual para cada cenário (total de 3 gráficos)."""
+    
+    figures = []
+    
+    for scen_name, df_summary in results_by_scenario.items():
+        # Nome limpo para arquivo
+        clean_name = scen_name.replace(' ', '_').replace('-', '').lower()
+        save_path = f"{save_dir}/{clean_name}_individual.png" if save_dir else None
+        
+        fig = plot_scenario_individual(
+            scenario_name=scen_name,
+            df_summary=df_summary,
+            save_path=save_path,
+            show=show
+        )
+        
+        figures.append(fig)
+    
+    return figures
+
+
+def create_interactive_dashboard(results_data: Dict[str, Dict], save_path: Optional[str] = None, show: bool = False) -> go.Figure:
+    """Cria dashboard interativo completo com análise abrangente dos 3 cenários e 6 investimentos."""
+    
+    # Criar subplots com layout 3x2 para mais análises
+    fig = make_subplots(
+        rows=3, cols=2,
+        subplot_titles=(
+            "Comparação de VF Líquido por Cenário", 
+            "Evolução Temporal - Tesouro Selic",
+            "Rentabilidade por Produto (%)", 
+            "Evolução Temporal - Todos os Produtos",
+            "Análise de Risco-Retorno", 
+            "Performance Relativa por Cenário"
+        ),
+        specs=[
+            [{"type": "bar"}, {"type": "scatter"}],
+            [{"type": "bar"}, {"type": "scatter"}], 
+            [{"type": "scatter"}, {"type": "bar"}]
+        ],
+        vertical_spacing=0.12,
+        horizontal_spacing=0.1
+    )
+    
+    # Cores para cenários
+    scenario_colors = {
+        'Cenario 1 - Manutencao': '#2E86AB',
+        'Cenario 2 - Aperto': '#A23B72', 
+        'Cenario 3 - Afrouxamento': '#F18F01'
+    }
+    
+    # Cores para produtos
+    product_colors = {
+        'Tesouro Selic': '#2E86AB',
+        'Tesouro Prefixado': '#C73E1D',
+        'Tesouro IPCA+': '#6A994E',
+        'CDB 100% CDI': '#F18F01',
+        'LCI': '#A23B72',
+        'Poupanca': '#8E44AD'
+    }
+    
+    # Preparar dados dos cenários
+    results_by_scenario = {name: data["summary"] for name, data in results_data.items()}
+    
+    # GRÁFICO 1: Comparação de VF Líquido por Cenário (Barras Agrupadas)
+    produtos = ["Tesouro Selic", "Tesouro Prefixado", "Tesouro IPCA+", "CDB 100% CDI", "LCI", "Poupanca"]
+    
+    # Matriz cenário × produto de VF líquido (NaN se o produto faltar no cenário) e
+    # rentabilidades correspondentes, calculadas de uma vez em vez de filtrar a
+    # DataFrame por produto em cada gráfico
+    vf_matrix = np.array([
+        df_summary.drop_duplicates("produto").set_index("produto")["vf_liquido"].reindex(produtos).to_numpy(dtype=np.float64)
+        for df_summary in results_by_scenario.values()
+    ]).reshape(len(results_by_scenario), len(produtos))
+    presente = ~np.isnan(vf_matrix)
+    rent_matrix = _rentabilidade_pct(vf_matrix)
+    
+    for i, scenario_name in enumerate(results_by_scenario):
+        vf_liquidos = np.where(presente[i], vf_matrix[i], 0.0)
+        
+        fig.add_trace(
+            go.Bar(
+                x=produtos,
+                y=vf_liquidos,
+                name=scenario_name,
+                marker_color=scenario_colors[scenario_name],
+                hovertemplate='<b>%{x}</b><br>Cenário: ' + scenario_name + '<br>VF Líquido: R$ %{y:,.0f}<extra></extra>'
+            ),
+            row=1, col=1
+        )
+    
+    # GRÁFICO 2: Evolução Temporal - Tesouro Selic
+    for scenario_name, data in results_data.items():
+        timelines = data.get("timelines", {})
+        if "Tesouro_Selic" in timelines:
+            timeline_df = timelines["Tesouro_Selic"]
+            dates = _bdays("2025-01-01", len(timeline_df))
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=dates,
+                    y=_timeline_column(data, "Tesouro_Selic", "saldo_liquido_estimado"),
+                    mode='lines',
+                    name=f'Selic - {scenario_name}',
+                    line=dict(color=scenario_colors[scenario_name], width=2),
+                    hovertemplate='<b>Tesouro Selic</b><br>Data: %{x}<br>Saldo: R$ %{y:,.0f}<br>Cenário: ' + scenario_name + '<extra></extra>',
+                    showlegend=False
+                ),
+                row=1, col=2
+            )
+    
+    # GRÁFICO 3: Rentabilidade por Produto (%)
+    for i, scenario_name in enumerate(results_by_scenario):
+        produtos_cenario = [produto for produto, ok in zip(produtos, presente[i]) if ok]
+        rentabilidades = rent_matrix[i][presente[i]]
+        
+        fig.add_trace(
+            go.Bar(
+                x=produtos_cenario,
+                y=rentabilidades,
+                name=f'Rent. {scenario_name}',
+                marker_color=scenario_colors[scenario_name],
+                hovertemplate='<b>%{x}</b><br>Cenário: ' + scenario_name + '<br>Rentabilidade: %{y:.1f}%<extra></extra>',
+                showlegend=False
+            ),
+            row=2, col=1
+        )
+    
+    # GRÁFICO 4: Evolução Temporal - Todos os Produtos (Cenário 1)
+    primeiro_cenario_data = list(results_data.values())[0]
+    timelines = primeiro_cenario_data.get("timelines", {})
+    
+    for produto_key, timeline_df in timelines.items():
+        produto_nome = format_product_name(produto_key)
+        if produto_nome in product_colors:
+            dates = _bdays("2025-01-01", len(timeline_df))
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=dates,
+                    y=_timeline_column(primeiro_cenario_data, produto_key, "saldo_liquido_estimado"),
+                    mode='lines',
+                    name=produto_nome,
+                    line=dict(color=product_colors[produto_nome], width=1.5),
+                    hovertemplate='<b>' + produto_nome + '</b><br>Data: %{x}<br>Saldo: R$ %{y:,.0f}<extra></extra>',
+                    showlegend=False
+                ),
+                row=2, col=2
+            )
+    
+    # GRÁFICO 5: Análise de Risco-Retorno (Rentabilidade vs Volatilidade)
+    # Média e meia-amplitude de todos os produtos de uma vez, em reduções por coluna
+    # sobre a matriz (cenários × produtos), só com os cenários presentes
+    n_presentes = presente.sum(axis=0)
+    rent_medias = np.add.reduce(rent_matrix, axis=0, where=presente, initial=0.0) / np.maximum(n_presentes, 1)
+    # Aproximação simples da volatilidade: metade da amplitude entre cenários
+    volatilidades = (
+        np.max(rent_matrix, axis=0, where=presente, initial=-np.inf)
+        - np.min(rent_matrix, axis=0, where=presente, initial=np.inf)
+    ) / 2
+    for j, produto in enumerate(produtos):
+        if n_presentes[j]:
+            rentabilidade_media = float(rent_medias[j])
+            volatilidade = float(volatilidades[j])
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[volatilidade],
+                    y=[rentabilidade_media],
+                    mode='markers+text',
+                    text=[produto.replace(' ', '<br>')],
+                    textposition='top center',
+                    marker=dict(
+                        size=15,
+                        color=product_colors.get(produto, '#95A5A6'),
+                        line=dict(width=2, color='white')
+                    ),
+                    name=produto,
+                    hovertemplate='<b>' + produto + '</b><br>Rentabilidade Média: %{y:.1f}%<br>Volatilidade: %{x:.1f}%<extra></extra>',
+                    showlegend=False
+                ),
+                row=3, col=1
+            )
+    
+    # GRÁFICO 6: Performance Relativa por Cenário (normalizado para 100%)
+    cenarios = list(results_by_scenario.keys())
+    for j, produto in enumerate(produtos):
+        performance_relativa = rent_matrix[:, j][presente[:, j]]
+        
+        if performance_relativa.size:
+            fig.add_trace(
+                go.Bar(
+                    x=cenarios,
+                    y=performance_relativa,
+                    name=produto,
+                    marker_color=product_colors.get(produto, '#95A5A6'),
+                    hovertemplate='<b>' + produto + '</b><br>Cenário: %{x}<br>Rentabilidade: %{y:.1f}%<extra></extra>',
+                    showlegend=False
+                ),
+                row=3, col=2
+            )
+    
+    # Atualizar layout geral
+    fig.update_layout(
+        title={
+            'text': "Dashboard Interativo Completo - Análise de Investimentos<br><span style='font-size:14px'>3 Cenários Econômicos × 6 Produtos de Investimento × 3 Anos</span>",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18, 'color': '#2E86AB'}
+        },
+        height=1200,
+        width=1400,
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial, sans-serif", size=10),
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.05,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    
+    # Atualizar eixos específicos
+    fig.update_xaxes(title_text="Produtos", row=1, col=1, tickangle=45)
+    fig.update_yaxes(title_text="VF Líquido (R$)", row=1, col=1, tickformat=',.0f')
+    
+    fig.update_xaxes(title_text="Data", row=1, col=2, tickformat='%m/%Y')
+    fig.update_yaxes(title_text="Saldo Líquido (R$)", row=1, col=2, tickformat=',.0f')
+    
+    fig.update_xaxes(title_text="Produtos", row=2, col=1, tickangle=45)
+    fig.update_yaxes(title_text="Rentabilidade (%)", row=2, col=1, ticksuffix='%')
+    
+    fig.update_xaxes(title_text="Data", row=2, col=2, tickformat='%m/%Y')
+    fig.update_yaxes(title_text="Saldo Líquido (R$)", row=2, col=2, tickformat=',.0f')
+    
+    fig.update_xaxes(title_text="Volatilidade (%)", row=3, col=1, ticksuffix='%')
+    fig.update_yaxes(title_text="Rentabilidade Média (%)", row=3, col=1, ticksuffix='%')
+    
+    fig.update_xaxes(title_text="Cenários", row=3, col=2)
+    fig.update_yaxes(title_text="Rentabilidade (%)", row=3, col=2, ticksuffix='%')
+    
+    if save_path:
+        _export_html(fig, save_path)
+    
+    if show:
+        fig.show()
+    
+    return fig
+
+
+def plot_rentability_by_product(results_data: Dict[str, Dict], save_dir: Optional[str] = None, show: bool = False) -> list[go.Figure]:
+    """Cria gráficos de evolução temporal da rentabilidade por produto (total 5 gráficos)."""
+    
+    figures = []
+    
+    # Produtos na ordem desejada
+    produtos_ordem = ["Tesouro Selic", "Tesouro Prefixado", "Tesouro IPCA+", "CDB 100% CDI", "LCI", "Poupanca"]
+    
+    # Cores para cenários
+    scenario_colors = {
+        'Cenario 1 - Manutencao': '#2E86AB',
+        'Cenario 2 - Aperto': '#A23B72', 
+        'Cenario 3 - Afrouxamento': '#F18F01'
+    }
+    
+    # Mapa nome de exibição -> chave da timeline, montado uma vez por cenário
+    # (a primeira chave vence, como na busca sequencial)
+    display_keys = {}
+    for scenario_name, data in results_data.items():
+        mapa = display_keys[scenario_name] = {}
+        for key in data.get("timelines", {}):
+            mapa.setdefault(format_product_name(key), key)
+    
+    for produto in produtos_ordem:
+        fig = go.Figure()
+        traces = []
+        
+        # Procurar o produto em cada cenário
+        for scenario_name, data in results_data.items():
+            timelines = data.get("timelines", {})
+            
+            # Encontrar a chave correta do produto
+            produto_key = display_keys[scenario_name].get(produto)
+            
+            if produto_key and produto_key in timelines:
+                timeline_df = timelines[produto_key]
+                color = scenario_colors.get(scenario_name, '#95A5A6')
+                
+                # Criar datas baseadas no período (iniciando em 2025-01-01)
+                dates = _bdays("2025-01-01", len(timeline_df))
+                
+                # Calcular rentabilidade acumulada ao longo do tempo (ndarray, operações no lugar)
+                saldo_liquido = _timeline_column(data, produto_key, "saldo_liquido_estimado")
+                rentabilidade_temporal = _rentabilidade_pct(saldo_liquido)
+                
+                # Linha da evolução da rentabilidade
+                traces.append(go.Scatter(
+                    x=dates,
+                    y=rentabilidade_temporal,
+                    mode='lines',
+                    name=scenario_name,
+                    line=dict(color=color, width=2),
+                    hovertemplate=f'<b>{scenario_name}</b><br>Data: %{{x}}<br>Rentabilidade: %{{y:.1f}}%<br>Saldo: R$ %{{customdata:,.2f}}<extra></extra>',
+                    customdata=saldo_liquido
+                ))
+        
+        fig.add_traces(traces)
+        
+        # Linha de referência em 0%
+        fig.add_hline(
+            y=0,
+            line_dash="dash",
+            line_color="gray",
+            annotation_text="Sem ganho/perda",
+            annotation_position="bottom right"
+        )
+        
+        fig.update_layout(
+            title={
+                'text': f"Evolução da Rentabilidade: {produto}<br><span style='font-size:14px'>Comparação Temporal entre Cenários</span>",
+                'x': 0.5,
+                'xanchor': 'center',
+                'font': {'size': 18, 'color': '#2E86AB'}
+            },
+            xaxis_title="Data",
+            yaxis_title="Rentabilidade Acumulada (%)",
+            height=500,
+            width=900,
+            margin=dict(l=60, r=60, t=100, b=80),
+            **_BASE_LAYOUT,
+            xaxis=dict(
+                **_GRID,
+                showline=True,
+                linecolor='gray',
+                tickformat='%d/%m/%Y',
+                dtick='M3',  # Mostrar marcas a cada 3 meses
+                tickangle=45  # Rotacionar datas em 45 graus
+            ),
+            yaxis=dict(
+                tickformat='.1f',
+                ticksuffix='%',
+                **_GRID,
+                showline=True,
+                linecolor='gray'
+            ),
+            legend=dict(
+                orientation="v",
+                x=0.98,
+                y=0.15,
+                xanchor="right",
+                yanchor="bottom",
+                bgcolor="rgba(255,255,255,0.6)",  # fundo translúcido
+                bordercolor="lightgray",
+                borderwidth=1
+            )
+        )
+        
+        # Salvar gráfico
+        if save_dir:
+            produto_clean = produto.replace(' ', '_').replace('+', 'Plus').replace('%', 'pct')
+            save_path = f"{save_dir}/{produto_clean.lower()}_rentabilidade_evolucao.png"
+            _export(fig, save_path, width=900, height=500, scale=PNG_SCALE)
+        
+        if show:
+            fig.show()
+        
+        figures.append(fig)
+    
+    return figures
+
+
+# Nomes de exibição que não saem da simples troca de '_' por espaço
+_PRODUCT_DISPLAY = MappingProxyType({
+    'Tesouro_IPCA_Plus': 'Tesouro IPCA+',
+    'CDB_100_CDI': 'CDB 100% CDI',
+})
+
+
+def format_product_name(produto_key: str) -> str:
+    """Converte nomes de produtos para exibição nos gráficos."""
+    nome = _PRODUCT_DISPLAY.get(produto_key)
+    return nome if nome is not None else produto_key.replace('_', ' ')
+
+
+def generate_all_plots(results_data: Dict[str, Dict], args, fig_dir: str) -> None:
+    """Centraliza toda a lógica de geração de gráficos baseada nos argumentos CLI."""
+    
+    # Verificar se deve gerar gráficos
+    if not (args.save_figures or args.plotly or args.individual or args.evolucao or args.rentabilidade or args.dashboard):
+        return
+    
+    # Criar diretório de figuras (caminho absoluto resolvido uma única vez)
+    fig_path = Path(fig_dir).resolve()
+    fig_path.mkdir(parents=True, exist_ok=True)
+    
+    # Preparar dados para gráficos
+    results_by_scenario = {name: data["summary"] for name, data in results_data.items()}
+    
+    # Um só navegador do Kaleido atende todas as exportações PNG desta execução,
+    # gravadas num único lote ao final. O relatório só é impresso depois do lote:
+    # se alguma exportação falhar, a exceção sai antes de qualquer "salvo"
+    with _persistent_image_server(), _deferred_exports():
+        relatorio = _generate_plots(results_data, results_by_scenario, args, fig_dir, fig_path)
+    for linha in relatorio:
+        print(linha)
+
+
+def _generate_plots(results_data: Dict[str, Dict], results_by_scenario: Dict[str, object], args, fig_dir: str, fig_path: Path) -> list[str]:
+    """Gera os gráficos pedidos na linha de comando (chamada por generate_all_plots).
+
+    Retorna as linhas do relatório, impressas por quem chama depois que as
+    exportações adiadas foram gravadas.
+    """
+    relatorio = []
+    if args.plotly or args.individual or args.evolucao or args.rentabilidade or args.dashboard:
+        # Gráficos Plotly interativos
+        print("\n🎨 Gerando gráficos interativos com Plotly...")
+        
+        # Gráficos de evolução temporal
+        if args.evolucao:
+            evolution_figures = plot_evolution_by_scenario(
+                results_data,
+                save_dir=fig_dir,
+                show=False
+            )
+            relatorio.append(f"📈 {len(evolution_figures)} gráficos de evolução criados (um por cenário)")
+            
+            # Gráfico comparativo de evolução
+            plot_evolution_comparison(
+                results_data,
+                save_path=f"{fig_dir}/evolucao_comparativa.png",
+                show=False
+            )
+            relatorio.append("📊 Gráfico comparativo de evolução criado")
+        
+        # Gráficos individuais por cenário
+        if args.individual:
+            individual_figures = plot_all_scenarios_individual(
+                results_by_scenario,
+                save_dir=fig_dir,
+                show=False
+            )
+            relatorio.append(f"📈 {len(individual_figures)} gráficos individuais criados (um por cenário)")
+        
+        # Gráficos de rentabilidade por produto
+        if args.rentabilidade:
+            rentability_figures = plot_rentability_by_product(
+                results_data,  # Usar results completo com timelines
+                save_dir=fig_dir,
+                show=False
+            )
+            relatorio.append(f"📊 {len(rentability_figures)} gráficos de evolução da rentabilidade criados (um por produto)")
+        
+        # Gráfico comparativo de todos os cenários
+        if args.plotly and not args.individual and not args.evolucao:
+            plot_comparison_all_scenarios(
+                results_by_scenario, 
+                save_path=f"{fig_dir}/comparacao_cenarios.png",
+                show=False
+            )
+        
+        # Dashboard interativo
+        if args.dashboard:
+            create_interactive_dashboard(
+                results_data,  # Usar results completo com timelines
+                save_path=f"{fig_dir}/dashboard_interativo.html",
+                show=False
+            )
+            relatorio.append(f"📊 Dashboard interativo completo salvo: {fig_dir}/dashboard_interativo.html")
+        
+        relatorio.append(f"🎯 Gráficos Plotly salvos em: {fig_path}")
+    else:
+        # Gráficos tradicionais (resumo por cenário, PNG estático via Kaleido)
+        plot_all_scenarios_summary(results_by_scenario=results_by_scenario, save_dir=fig_dir, show=False)
+    return relatorio
+
+
+__all__ = [
+    "plot_summary_bar",
+    "plot_timeline",
+    "plot_all_scenarios_summary",
+    "plot_comparison_all_scenarios",
+    "plot_ir_evolution",
+    "plot_scenario_individual",
+    "plot_all_scenarios_individual",
+    "plot_evolution_by_scenario",
+    "plot_evolution_comparison",
+    "plot_rentability_by_product",
+    "create_interactive_dashboard",
+    "generate_all_plots",
+    "format_product_name"
+]
+
+
@@ -0,0 +1,535 @@
+from __future__ import annotations
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable
+import numpy as np
+import pandas as pd
+from .rates import (
+    annual_to_monthly, equivalent_periodic_fee, get_period_converters,
+    conversion_periods, annual_to_period_vec, period_to_annual_vec,
+)
+from .config import TR_MENSAL_FIXA, DIAS_UTEIS_POR_ANO, SPREAD_CDI_SELIC
+from .taxes import get_ir_rate_by_periods, calculate_ir_provision_series
+
+
+# slots=True só existe a partir do Python 3.10; no 3.9 a classe segue com __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class SimulationParams:
+    """Parâmetros de simulação.
+
+    ``custody_per_period`` (custódia equivalente por período) é derivada de
+    ``annual_custody`` e ``periods_per_year`` uma vez, na criação. Com slots,
+    sem ``__dict__`` por instância.
+    """
+    initial: float
+    annual_custody: float = 0.002
+    periods_per_year: int = 12
+    custody_per_period: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Dataclass congelada: atribuição via object.__setattr__
+        object.__setattr__(
+            self, "custody_per_period", equivalent_periodic_fee(self.annual_custody, self.periods_per_year)
+        )
+
+
+def _as_rates(values: Iterable[float]) -> np.ndarray:
+    """Materializa uma série de taxas como array float64 contíguo, uma única vez.
+
+    Um ndarray float64 contíguo passa sem cópia; listas e tuplas são convertidas
+    direto e qualquer outro iterável (ex.: gerador) é consumido por ``np.fromiter``.
+    """
+    if isinstance(values, (np.ndarray, list, tuple)):
+        return np.ascontiguousarray(values, dtype=np.float64)
+    return np.fromiter(values, dtype=np.float64)
+
+
+def _timeline_kernel(
+    taxa: np.ndarray,
+    initial: float,
+    custody_per_period: np.ndarray,
+    apply_custody: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Núcleo numérico da simulação: (saldo_bruto, custodia, saldo_pos_custodia) por período.
+
+    Opera sobre uma matriz de taxas (produtos, períodos) e vetores por produto
+    de custódia, sem DataFrames nem regras de IR; cada linha é um produto.
+    """
+    # Buffer único (produtos, 1 + períodos), contíguo por linha: coluna 0 é o capital
+    # inicial e as demais recebem os fatores (1 + taxa), acumulados depois no próprio buffer
+    buffer = np.empty((taxa.shape[0], taxa.shape[1] + 1), dtype=np.float64)
+    buffer[:, 0] = initial
+    one_plus = np.add(1.0, taxa, out=buffer[:, 1:])
+
+    # Saldo com custódia: a cada período rende e paga a taxa sobre o saldo já rendido,
+    # ou seja, é o produto acumulado de (1 + taxa) * (1 - custódia)
+    c = custody_per_period[:, None]
+    saldo_com_custodia = one_plus * (1.0 - c)
+    np.multiply.accumulate(saldo_com_custodia, axis=1, out=saldo_com_custodia)
+    saldo_com_custodia *= initial
+
+    # Saldo bruto: produto acumulado dos fatores de rendimento, partindo do capital
+    # inicial (mesma ordem de multiplicação do acúmulo período a período)
+    np.multiply.accumulate(buffer, axis=1, out=buffer)
+    saldo_sem_custodia = buffer[:, 1:]
+    custodia = saldo_com_custodia * (c / (1.0 - c))
+
+    # Produtos sem custódia: saldo igual ao bruto e custódia zero
+    sem = ~apply_custody
+    saldo_com_custodia[sem] = saldo_sem_custodia[sem]
+    custodia[sem] = 0.0
+
+    return saldo_sem_custodia, custodia, saldo_com_custodia
+
+
+def _ir_provision_matrix(saldo_bruto: np.ndarray, params: SimulationParams, ir_exempt: np.ndarray) -> np.ndarray:
+    """Provisão de IR por (produto, período), como calculate_ir_provision elemento a elemento."""
+    # A série inteira de cada produto de uma vez (alíquota por período calculada uma
+    # só vez para todas as linhas); isentos não provisionam
+    provisao = calculate_ir_provision_series(params.initial, saldo_bruto, params.periods_per_year)
+    return np.where(ir_exempt[:, None], 0.0, provisao)
+
+
+def _final_values(
+    taxa: np.ndarray,
+    params: SimulationParams,
+    custody_per_period: np.ndarray,
+    apply_custody: np.ndarray,
+    ir_exempt: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(vf_bruto, ir_final, vf_liquido) por produto, sem montar os saldos período a período.
+
+    Os saldos finais saem de um único produto (reduce) dos fatores de cada linha,
+    na mesma ordem de multiplicação do acúmulo em _timeline_kernel.
+    """
+    # Mesmo buffer (produtos, 1 + períodos) de _timeline_kernel: capital inicial na
+    # coluna 0 e fatores (1 + taxa) escritos direto nas demais, sem concatenate
+    buffer = np.empty((taxa.shape[0], taxa.shape[1] + 1), dtype=np.float64)
+    buffer[:, 0] = params.initial
+    one_plus = np.add(1.0, taxa, out=buffer[:, 1:])
+    saldo_final = params.initial * np.prod(one_plus * (1.0 - custody_per_period[:, None]), axis=1)
+    vf_bruto = np.multiply.reduce(buffer, axis=1)
+    saldo_final[~apply_custody] = vf_bruto[~apply_custody]
+
+    # IR final com a alíquota do último período; zero se isento ou sem rendimento
+    rendimento = np.maximum(vf_bruto - params.initial, 0.0)
+    aliquota = get_ir_rate_by_periods(taxa.shape[1] - 1, params.periods_per_year)
+    ir_final = np.where(ir_exempt, 0.0, rendimento * aliquota)
+    return vf_bruto, ir_final, saldo_final - ir_final
+
+
+def _simulate_rows(
+    rates_matrix,
+    params: SimulationParams,
+    produtos: list[str],
+    apply_custody,
+    ir_exempt,
+    with_timeline: bool = True,
+    timeline_dtype=np.float64,
+) -> list[dict]:
+    """Simula cada linha de uma matriz de taxas (linhas, períodos) como um produto.
+
+    Retorna um resultado por linha, na mesma ordem; os nomes em ``produtos``
+    podem se repetir (ex.: o mesmo produto em cenários diferentes).
+    """
+    taxa = np.array(rates_matrix, dtype=np.float64, ndmin=2)
+    n_produtos, n = taxa.shape
+    apply_custody = np.broadcast_to(np.asarray(apply_custody, dtype=bool), (n_produtos,))
+    ir_exempt = np.broadcast_to(np.asarray(ir_exempt, dtype=bool), (n_produtos,))
+
+    custody_per_period = np.where(
+        apply_custody, params.custody_per_period, 0.0
+    )
+
+    if not with_timeline:
+        if n > 0:
+            vf_bruto, ir_final, vf_liquido = _final_values(taxa, params, custody_per_period, apply_custody, ir_exempt)
+        else:
+            vf_bruto = vf_liquido = np.full(n_produtos, params.initial)
+            ir_final = np.zeros(n_produtos)
+        return [
+            {
+                "produto": produto_nome,
+                "timeline": None,
+                "vf_bruto": float(vf_bruto[k]),
+                "ir_final": float(ir_final[k]),
+                "vf_liquido": float(vf_liquido[k]),
+            }
+            for k, produto_nome in enumerate(produtos)
+        ]
+
+    saldo_sem_custodia, custodia, saldo_com_custodia = _timeline_kernel(
+        taxa, params.initial, custody_per_period, apply_custody
+    )
+    provisao_ir = _ir_provision_matrix(saldo_sem_custodia, params, ir_exempt)
+    # Saldo líquido escrito sobre o saldo com custódia (que não vira coluna): sem nova matriz
+    saldo_liquido = np.subtract(saldo_com_custodia, provisao_ir, out=saldo_com_custodia)
+
+    if n > 0:
+        vf_bruto = saldo_sem_custodia[:, -1]
+        # IR final: provisão do último período (que tem a alíquota final); zero se isento
+        ir_final = provisao_ir[:, -1]
+        # Último saldo com custódia menos o IR final, já calculado na matriz líquida
+        vf_liquido = saldo_liquido[:, -1]
+    else:
+        vf_bruto = vf_liquido = np.full(n_produtos, params.initial)
+        ir_final = np.zeros(n_produtos)
+
+    # Coluna de períodos única, somente leitura, compartilhada por todas as timelines
+    periodo = np.arange(1, n + 1)
+    periodo.flags.writeable = False
+    # Lista de tamanho fixo (uma posição por linha), preenchida por índice
+    resultados: list = [None] * len(produtos)
+    for k, produto_nome in enumerate(produtos):
+        # Linhas da matriz viram colunas da timeline do produto: no tipo de cálculo
+        # (float64) são as próprias linhas, contíguas, sem cópia; em outro tipo de
+        # armazenamento, cópias convertidas. Nenhum array é alocado por período:
+        # tudo sai das matrizes do kernel. Os mesmos arrays, somente leitura,
+        # ficam em "arrays" para quem quer o ndarray sem passar pelo pandas
+        colunas = {
+            "periodo": periodo,
+            "taxa": taxa[k].astype(timeline_dtype, copy=False),
+            "saldo_bruto": saldo_sem_custodia[k].astype(timeline_dtype, copy=False),
+            "custodia": custodia[k].astype(timeline_dtype, copy=False),
+            "provisao_ir": provisao_ir[k].astype(timeline_dtype, copy=False),
+            "saldo_liquido_estimado": saldo_liquido[k].astype(timeline_dtype, copy=False),
+        }
+        for arr in colunas.values():
+            arr.flags.writeable = False
+        df = pd.DataFrame(colunas, copy=False)
+        resultados[k] = {
+            "produto": produto_nome,
+            "timeline": df,
+            "arrays": colunas,
+            "vf_bruto": float(vf_bruto[k]),
+            "ir_final": float(ir_final[k]),
+            "vf_liquido": float(vf_liquido[k]),
+        }
+    return resultados
+
+
+def simulate_all_products(
+    rates_matrix,
+    params: SimulationParams,
+    produtos: list[str],
+    apply_custody,
+    ir_exempt,
+    with_timeline: bool = True,
+    timeline_dtype=np.float64,
+) -> dict[str, dict]:
+    """Simula vários produtos de uma vez sobre uma matriz de taxas (produtos, períodos).
+
+    ``apply_custody`` e ``ir_exempt`` são vetores booleanos com um valor por produto.
+    Retorna {produto: resultado}, cada resultado no formato de simulate_product;
+    as timelines só são separadas por produto na saída. Com ``with_timeline=False``
+    só os valores finais são calculados e ``timeline`` é None.
+
+    ``timeline_dtype`` define o tipo das colunas monetárias/taxas da timeline
+    (ex.: np.float32 para metade da memória); o cálculo e os valores finais
+    continuam em float64. O padrão float64 preserva os centavos: em float32 o
+    espaçamento entre valores perto de R$ 100 mil já é de ~0,8 centavo.
+    """
+    resultados = _simulate_rows(
+        rates_matrix, params, produtos, apply_custody, ir_exempt,
+        with_timeline=with_timeline, timeline_dtype=timeline_dtype,
+    )
+    return dict(zip(produtos, resultados))
+
+
+def simulate_product(
+    rates: Iterable[float],
+    params: SimulationParams,
+    produto_nome: str,
+    apply_custody: bool = True,
+    ir_exempt: bool = False,
+    with_timeline: bool = True,
+) -> dict:
+    """Simula um produto financeiro genérico.
+
+    Com ``with_timeline=False`` não monta a timeline (``timeline`` é None),
+    apenas vf_bruto, ir_final e vf_liquido.
+    """
+    taxa = _as_rates(rates)
+    return simulate_all_products(
+        taxa[None, :], params, [produto_nome], [apply_custody], [ir_exempt], with_timeline=with_timeline
+    )[produto_nome]
+
+
+def calculate_prefixado_rates(meses: int, params: SimulationParams, taxa_anual: float = 0.14) -> np.ndarray:
+    """Taxas por período do Tesouro Prefixado (taxa fixa anual convertida)."""
+    # Determina função de conversão baseada na frequência da simulação
+    _, convert_rate = get_period_converters(params.periods_per_year)
+    
+    # Converte taxa anual para o período da simulação e replica para todos os períodos
+    rate = convert_rate(taxa_anual)
+    return np.full(meses, rate, dtype=np.float64)
+
+
+def simulate_tesouro_prefixado(meses: int, params: SimulationParams, taxa_anual: float = 0.14, with_timeline: bool = True) -> dict:
+    """Tesouro Prefixado: taxa fixa de 14% a.a."""
+    rates = calculate_prefixado_rates(meses, params, taxa_anual)
+    return simulate_product(rates, params, "Tesouro Prefixado", apply_custody=True, ir_exempt=False, with_timeline=with_timeline)
+
+
+def calculate_ipca_plus_rates(ipca_mensal: Iterable[float], params: SimulationParams, juro_real_anual: float = 0.07) -> np.ndarray:
+    """Taxas por período do Tesouro IPCA+ (IPCA composto com o juro real)."""
+    # Frequência das conversões baseada na frequência da simulação
+    n = conversion_periods(params.periods_per_year)
+    
+    # Converte juro real anual e IPCA para o período da simulação
+    i_real_periodo = annual_to_period_vec(juro_real_anual, n)
+    ipca_periodo = annual_to_period_vec(_as_rates(ipca_mensal), n)
+    
+    # Compõe as taxas de todos os períodos: (1+ipca)*(1+real) - 1
+    return (1.0 + ipca_periodo) * (1.0 + i_real_periodo) - 1.0
+
+
+def simulate_tesouro_ipca_plus(ipca_mensal: Iterable[float], params: SimulationParams, juro_real_anual: float = 0.07, with_timeline: bool = True) -> dict:
+    """Tesouro IPCA+: IPCA + 7% a.a. real."""
+    rates = calculate_ipca_plus_rates(ipca_mensal, params, juro_real_anual)
+    return simulate_product(rates, params, "Tesouro IPCA+", apply_custody=True, ir_exempt=False, with_timeline=with_timeline)
+
+
+def simulate_tesouro_selic(selic_mensal: Iterable[float], params: SimulationParams, with_timeline: bool = True) -> dict:
+    """Tesouro Selic: acompanha a Selic."""
+    return simulate_product(selic_mensal, params, "Tesouro Selic", apply_custody=True, ir_exempt=False, with_timeline=with_timeline)
+
+
+def calculate_cdi_from_selic(selic_rates: Iterable[float], params: SimulationParams) -> np.ndarray:
+    """Calcula taxas CDI baseadas na Selic com spread realista.
+    
+    CDI geralmente fica 0,1 p.p. abaixo da Selic (conforme B3).
+    Exemplo: Se Selic = 15% a.a. → CDI ≈ 14,9% a.a.
+    """
+    # Frequência das conversões baseada na frequência da simulação
+    n = conversion_periods(params.periods_per_year)
+    
+    # Converte para anual, aplica spread (-0,1 p.p.) e converte de volta, em todos os períodos
+    selic_anual = period_to_annual_vec(_as_rates(selic_rates), n)
+    return _cdi_from_selic_anual(selic_anual, n)
+
+
+def _cdi_from_selic_anual(selic_anual: np.ndarray, n: int) -> np.ndarray:
+    """Taxas CDI por período a partir da Selic já anualizada."""
+    return annual_to_period_vec(selic_anual + SPREAD_CDI_SELIC, n)
+
+
+def simulate_cdb_cdi(selic_rates: Iterable[float], params: SimulationParams, with_timeline: bool = True) -> dict:
+    """CDB 100% CDI: CDI fica ~0,1 p.p. abaixo da Selic (conforme B3)."""
+    cdi_rates = calculate_cdi_from_selic(selic_rates, params)
+    return simulate_product(cdi_rates, params, "CDB 100% CDI", apply_custody=True, ir_exempt=False, with_timeline=with_timeline)
+
+
+def calculate_lci_rates(selic_mensal: Iterable[float], params: SimulationParams, fator: float = 0.90) -> np.ndarray:
+    """Taxas por período da LCI: fração ``fator`` da Selic anual equivalente.
+    
+    Implementa corretamente: Se Selic = 15% a.a., então LCI = 13,5% a.a.
+    Converte a taxa anual equivalente e depois para o período da simulação.
+    """
+    # Frequência das conversões baseada na frequência da simulação
+    n = conversion_periods(params.periods_per_year)
+    
+    # Calcula taxas LCI para todos os períodos
+    selic_anual = period_to_annual_vec(_as_rates(selic_mensal), n)
+    return _lci_from_selic_anual(selic_anual, n, fator)
+
+
+def _lci_from_selic_anual(selic_anual: np.ndarray, n: int, fator: float = 0.90) -> np.ndarray:
+    """Taxas LCI por período a partir da Selic já anualizada."""
+    return annual_to_period_vec(fator * selic_anual, n)
+
+
+def simulate_lci(selic_mensal: Iterable[float], params: SimulationParams, fator: float = 0.90, with_timeline: bool = True) -> dict:
+    """LCI: 90% da Selic, isenta de IR."""
+    rates = calculate_lci_rates(selic_mensal, params, fator)
+    return simulate_product(rates, params, "LCI", apply_custody=True, ir_exempt=True, with_timeline=with_timeline)
+
+def get_poupanca_base_rate(selic_aa: float) -> float:
+    """Calcula taxa base da poupança (sem TR) em termos mensais."""
+    if selic_aa > 0.085:  # Selic > 8,5% a.a.
+        return 0.005  # 0,5% a.m.
+    return annual_to_monthly(0.70 * selic_aa)
+
+
+def poupanca_base_rates(selic_aa: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de get_poupanca_base_rate para um array de Selic anual."""
+    # 70% da Selic convertido a.m., como annual_to_monthly(0.70 * selic_aa)
+    regra_70 = (1.0 + 0.70 * selic_aa) ** (1.0 / 12.0) - 1.0
+    return np.where(selic_aa > 0.085, 0.005, regra_70)  # Selic > 8,5% a.a. → 0,5% a.m.
+
+
+def calculate_poupanca_rates(selic_anual: Iterable[float], params: SimulationParams) -> np.ndarray:
+    """Taxas por período da poupança conforme regra vigente:
+    - Selic > 8,5% a.a. → 0,5% a.m. + TR
+    - Selic ≤ 8,5% a.a. → 70% da Selic a.a. (convertido a.m.) + TR
+    Obs: Capitalização é mensal (data de aniversário).
+    """
+    selic = _as_rates(selic_anual)
+    
+    if params.periods_per_year == DIAS_UTEIS_POR_ANO:
+        # Simulação diária: capitalização apenas no aniversário (último dia do mês)
+        dias_por_mes = 21
+        n_meses = len(selic) // dias_por_mes
+        
+        # 20 dias sem rendimento + 1 dia com taxa mensal; dias após o último mês
+        # completo ficam sem rendimento. Um único array do tamanho final, sem
+        # preenchimento posterior nem listas intermediárias
+        rates = np.zeros(len(selic))
+        aniversarios = rates[dias_por_mes - 1:n_meses * dias_por_mes:dias_por_mes]
+        
+        # Taxa mensal da poupança (base + TR), pela Selic do primeiro dia de cada mês,
+        # escrita direto nos dias de aniversário (visão sobre rates)
+        aniversarios[:] = poupanca_base_rates(selic[:n_meses * dias_por_mes:dias_por_mes])
+        aniversarios += TR_MENSAL_FIXA
+    else:
+        # Simulação mensal: aplica taxa mensal diretamente
+        rates = poupanca_base_rates(selic)
+        rates += TR_MENSAL_FIXA
+    
+    return rates
+
+
+def simulate_poupanca(selic_anual: Iterable[float], params: SimulationParams, with_timeline: bool = True) -> dict:
+    """Simula a poupança (isenta de IR e sem custódia); regra em calculate_poupanca_rates."""
+    rates = calculate_poupanca_rates(selic_anual, params)
+    return simulate_product(rates, params, "Poupanca", apply_custody=False, ir_exempt=True, with_timeline=with_timeline)
+
+
+# Produtos simulados em lote por cenário, na ordem dos resultados:
+# (nome, aplica custódia, isento de IR)
+_SCENARIO_PRODUCTS = (
+    ("Tesouro Prefixado", True, False),
+    ("Tesouro IPCA+", True, False),
+    ("Tesouro Selic", True, False),
+    ("CDB 100% CDI", True, False),
+    ("LCI", True, True),
+    ("Poupanca", False, True),
+)
+
+
+def _scenario_rates_matrix(
+    selic: Iterable[float],
+    ipca: Iterable[float],
+    selic_aa: Iterable[float],
+    params: SimulationParams,
+) -> np.ndarray:
+    """Matriz (6, períodos) de taxas de um cenário, na ordem de ``_SCENARIO_PRODUCTS``."""
+    # Selic materializada e anualizada uma vez; CDI e LCI derivam da mesma série anual
+    selic = _as_rates(selic)
+    n = conversion_periods(params.periods_per_year)
+    selic_anual = period_to_annual_vec(selic, n)
+    return np.array([
+        calculate_prefixado_rates(len(selic), params),
+        calculate_ipca_plus_rates(ipca, params),
+        selic,
+        _cdi_from_selic_anual(selic_anual, n),
+        _lci_from_selic_anual(selic_anual, n),
+        calculate_poupanca_rates(selic_aa, params),
+    ], dtype=np.float64)
+
+
+def simulate_scenario_products(
+    selic: Iterable[float],
+    ipca: Iterable[float],
+    selic_aa: Iterable[float],
+    params: SimulationParams,
+    with_timeline: bool = True,
+    timeline_dtype=np.float64,
+) -> list[dict]:
+    """Simula os seis produtos de um cenário numa única passada matricial.
+
+    ``selic`` é a Selic por período, ``ipca`` a série que alimenta o Tesouro IPCA+
+    e ``selic_aa`` a Selic anual usada na poupança. Retorna os resultados na ordem
+    de ``_SCENARIO_PRODUCTS`` (mesmo formato de simulate_product);
+    ``timeline_dtype`` como em simulate_all_products.
+    """
+    return simulate_scenarios_products(
+        [(selic, ipca, selic_aa)], params,
+        with_timeline=with_timeline, timeline_dtype=timeline_dtype,
+    )[0]
+
+
+def scenarios_rates_matrix(
+    series: list[tuple[Iterable[float], Iterable[float], Iterable[float]]],
+    params: SimulationParams,
+) -> np.ndarray:
+    """Matriz (cenários × 6, períodos) de taxas: um bloco de _SCENARIO_PRODUCTS por cenário.
+
+    Só depende das séries e de ``params``: pode ser reaproveitada (ex.: em cache)
+    por simulate_scenarios_matrix entre execuções com os mesmos cenários.
+    """
+    return np.concatenate([_scenario_rates_matrix(*s, params) for s in series])
+
+
+def simulate_scenarios_matrix(
+    rates_matrix: np.ndarray,
+    params: SimulationParams,
+    with_timeline: bool = True,
+    timeline_dtype=np.float64,
+) -> list[list[dict]]:
+    """Simula uma matriz de scenarios_rates_matrix; uma lista de resultados por cenário.
+
+    Produtos com a mesma linha de taxas em todos os cenários (ex.: Prefixado, de
+    taxa fixa) são simulados uma única vez; os demais cenários recebem cópias
+    rasas desse resultado (mesmos arrays somente leitura, DataFrame própria).
+    """
+    produtos, apply_custody, ir_exempt = zip(*_SCENARIO_PRODUCTS)
+    n_produtos = len(produtos)
+    n_cenarios = len(rates_matrix) // n_produtos
+    blocos = np.asarray(rates_matrix).reshape(n_cenarios, n_produtos, -1)
+    repetidos = [
+        n_cenarios > 1 and bool((blocos[1:, j] == blocos[0, j]).all())
+        for j in range(n_produtos)
+    ]
+
+    # Linhas efetivamente simuladas: todas do primeiro cenário e, nos demais, só
+    # os produtos que variam entre cenários
+    linhas = [
+        (c, j) for c in range(n_cenarios) for j in range(n_produtos)
+        if c == 0 or not repetidos[j]
+    ]
+    resultados = _simulate_rows(
+        blocos[[c for c, _ in linhas], [j for _, j in linhas]], params,
+        [produtos[j] for _, j in linhas],
+        [apply_custody[j] for _, j in linhas], [ir_exempt[j] for _, j in linhas],
+        with_timeline=with_timeline, timeline_dtype=timeline_dtype,
+    )
+    por_linha = dict(zip(linhas, resultados))
+    return [
+        [
+            por_linha[(c, j)] if (c, j) in por_linha else _shallow_result(por_linha[(0, j)])
+            for j in range(n_produtos)
+        ]
+        for c in range(n_cenarios)
+    ]
+
+
+def _shallow_result(resultado: dict) -> dict:
+    """Cópia de um resultado de _simulate_rows que não compartilha objetos mutáveis."""
+    copia = dict(resultado)
+    if copia["timeline"] is not None:
+        copia["timeline"] = copia["timeline"].copy(deep=False)
+        copia["arrays"] = dict(copia["arrays"])
+    return copia
+
+
+def simulate_scenarios_products(
+    series: list[tuple[Iterable[float], Iterable[float], Iterable[float]]],
+    params: SimulationParams,
+    with_timeline: bool = True,
+    timeline_dtype=np.float64,
+) -> list[list[dict]]:
+    """Simula os seis produtos de vários cenários numa única passada matricial.
+
+    ``series`` traz um (selic, ipca, selic_aa) por cenário, como em
+    simulate_scenario_products, todos com o mesmo número de períodos: as linhas
+    cenários × produtos formam uma só matriz. Retorna uma lista de resultados
+    por cenário, na ordem de entrada.
+    """
+    return simulate_scenarios_matrix(
+        scenarios_rates_matrix(series, params), params,
+        with_timeline=with_timeline, timeline_dtype=timeline_dtype,
+    )
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Callable, Iterable, List, Tuple
+
+import numpy as np
+
+from .config import DIAS_UTEIS_POR_ANO
 
 
 # ------------------------------
 # Conversões de taxas
 # ------------------------------
+# Funções puras chamadas com poucas taxas distintas por execução (ex.: a taxa
+# fixa do Prefixado, a custódia anual): o resultado fica memoizado
+@lru_cache(maxsize=64)
 def annual_to_monthly(i_a: float) -> float:
     """Converte taxa efetiva anual em taxa efetiva mensal.
 
@@ -14,6 +22,7 @@ def annual_to_monthly(i_a: float) -> float:
     return (1.0 + i_a) ** (1.0 / 12.0) - 1.0
 
 
+@lru_cache(maxsize=64)
 def annual_to_daily(i_a: float, dias_uteis_ano: int = 252) -> float:
     """Converte taxa efetiva anual em taxa efetiva diária (dias úteis)."""
     return (1.0 + i_a) ** (1.0 / float(dias_uteis_ano)) - 1.0
@@ -29,6 +38,51 @@ def daily_to_annual(i_d: float, dias_uteis_ano: int = 252) -> float:
     return (1.0 + i_d) ** float(dias_uteis_ano) - 1.0
 
 
+def conversion_periods(periods_per_year: int) -> int:
+    """Períodos por ano usados nas conversões: diária (dias úteis) ou, nos demais casos, mensal."""
+    return DIAS_UTEIS_POR_ANO if periods_per_year == DIAS_UTEIS_POR_ANO else 12
+
+
+def get_period_converters(periods_per_year: int) -> Tuple[Callable[[float], float], Callable[[float], float]]:
+    """Par (período -> anual, anual -> período) para a frequência da simulação.
+
+    Diária (dias úteis) quando ``periods_per_year`` é DIAS_UTEIS_POR_ANO, senão mensal.
+    """
+    if conversion_periods(periods_per_year) == DIAS_UTEIS_POR_ANO:
+        return daily_to_annual, annual_to_daily
+    return monthly_to_annual, annual_to_monthly
+
+
+# ------------------------------
+# Conversões vetorizadas (arrays NumPy)
+# ------------------------------
+def _compound_vec(taxas, expoente: float) -> np.ndarray:
+    """(1+taxas)^expoente - 1 elemento a elemento, num único array de saída.
+
+    Soma, potência e subtração reutilizam o mesmo buffer (ufuncs com ``out``),
+    sem os temporários da expressão encadeada; aceita arrays de qualquer forma
+    (ex.: vários caminhos de taxa empilhados).
+    """
+    taxas = np.asarray(taxas, dtype=np.float64)
+    if taxas.ndim == 0:
+        # Escalar: não há buffer a reaproveitar
+        return (1.0 + taxas) ** expoente - 1.0
+    out = np.add(1.0, taxas)
+    np.power(out, expoente, out=out)
+    np.subtract(out, 1.0, out=out)
+    return out
+
+
+def annual_to_period_vec(i_a, periods_per_year: int) -> np.ndarray:
+    """Versão vetorizada de annual_to_monthly/annual_to_daily: (1+i_a)^(1/n) - 1."""
+    return _compound_vec(i_a, 1.0 / float(periods_per_year))
+
+
+def period_to_annual_vec(i_p, periods_per_year: int) -> np.ndarray:
+    """Versão vetorizada de monthly_to_annual/daily_to_annual: (1+i_p)^n - 1."""
+    return _compound_vec(i_p, float(periods_per_year))
+
+
 # ------------------------------
 # Composição de taxas (ex.: IPCA+)
 # ------------------------------
@@ -45,6 +99,7 @@ def real_rate_from_nominal_inflation(nominal: float, ipca: float) -> float:
 # ------------------------------
 # Ajustes por taxas de custódia/encargos
 # ------------------------------
+@lru_cache(maxsize=32)
 def equivalent_periodic_fee(annual_fee: float, periods_per_year: int) -> float:
     """Equivalente por período para uma taxa anual de custódia/fee.
 
@@ -85,6 +140,10 @@ __all__ = [
     "annual_to_daily",
     "monthly_to_annual",
     "daily_to_annual",
+    "conversion_periods",
+    "get_period_converters",
+    "annual_to_period_vec",
+    "period_to_annual_vec",
     "compose_ipca_plus",
     "real_rate_from_nominal_inflation",
     "equivalent_periodic_fee",
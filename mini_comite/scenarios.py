@@ -0,0 +1,310 @@
+
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+import hashlib
+import os
+import warnings
+import numpy as np
+import pandas as pd
+from .config import (
+    ANOS_SIMULACAO, MESES_SIMULACAO, DIAS_UTEIS_SIMULACAO, DIAS_UTEIS_POR_ANO,
+    CENARIOS_CONFIG, CACHE_DIR,
+)
+# Conversões reexportadas aqui por compatibilidade (antes definidas neste módulo);
+# a implementação fica em rates.py
+from .rates import annual_to_monthly, annual_to_daily  # noqa: F401
+
+
+@dataclass(frozen=True, eq=False)
+class CenarioEconomico:
+    """Define um cenário econômico com trajetórias de Selic e IPCA.
+
+    As trajetórias anuais são convertidas uma única vez para arrays float64
+    somente leitura, prontos para as operações vetorizadas do NumPy.
+    """
+    nome: str
+    descricao: str
+    selic_por_ano: np.ndarray
+    ipca_por_ano: np.ndarray
+
+    def __post_init__(self) -> None:
+        # Dataclass congelada: atribuição via object.__setattr__
+        for campo in ("selic_por_ano", "ipca_por_ano"):
+            arr = np.array(getattr(self, campo), dtype=np.float64)
+            arr.flags.writeable = False
+            object.__setattr__(self, campo, arr)
+
+
+# Dtype das colunas de taxa dos cenários. float64 por padrão: as simulações
+# compõem centenas de períodos e, com taxas float32 (~7 dígitos), o saldo final
+# já varia na casa do centésimo de centavo. Quem só lê/agrega as taxas pode
+# pedir np.float32 e ler metade dos bytes
+DTYPE_FLOAT = np.float64
+
+
+@lru_cache(maxsize=32)
+def _periodic_rates_by_year(cenario: CenarioEconomico, periods_per_year: int) -> tuple[np.ndarray, np.ndarray]:
+    """Tabela (Selic, IPCA) por período equivalente a cada ano do cenário.
+
+    Uma potência por ano, calculada uma vez por cenário e frequência e
+    compartilhada pelas construções mensal, diária e pelas colunas diárias
+    extras. Os arrays são somente leitura.
+    """
+    tabela = []
+    for por_ano in (cenario.selic_por_ano, cenario.ipca_por_ano):
+        taxa = (1.0 + por_ano[:ANOS_SIMULACAO]) ** (1.0 / periods_per_year) - 1.0
+        taxa.flags.writeable = False
+        tabela.append(taxa)
+    return tabela[0], tabela[1]
+
+
+def _expand_by_year(values: np.ndarray, periods_per_year: int, total_periods: int) -> np.ndarray:
+    """Repete cada valor anual ``periods_per_year`` vezes e trunca em ``total_periods``."""
+    return np.repeat(values, periods_per_year)[:total_periods]
+
+
+def build_scenario_arrays(
+    cenario: CenarioEconomico, granularity: str = "monthly", float_dtype=DTYPE_FLOAT
+) -> Dict[str, np.ndarray]:
+    """Colunas numéricas do cenário como ndarrays (sem DataFrame).
+
+    Mesmas chaves e valores das colunas de build_scenario_dataframe, exceto
+    ``scenario``: para quem só faz contas sobre as séries. As taxas saem em
+    ``float_dtype`` (o cast é feito na tabela anual, antes da expansão).
+    """
+    if granularity == "monthly":
+        total_periods = MESES_SIMULACAO
+        periods_per_year = 12
+        index_name = "month_index"
+        rate_suffix = "m"
+    elif granularity == "daily":
+        total_periods = DIAS_UTEIS_SIMULACAO
+        periods_per_year = DIAS_UTEIS_POR_ANO
+        index_name = "day_index"
+        rate_suffix = "d"
+    else:
+        raise ValueError("Granularidade deve ser 'monthly' ou 'daily'.")
+    for campo in ("selic_por_ano", "ipca_por_ano"):
+        n_anos = len(getattr(cenario, campo))
+        if n_anos < ANOS_SIMULACAO:
+            raise ValueError(
+                f"Cenário '{cenario.nome}': {campo} tem {n_anos} ano(s); "
+                f"são necessários ao menos {ANOS_SIMULACAO}."
+            )
+
+    # Taxas periódicas vêm da tabela por ano (uma potência por ano) e só então
+    # cada ano é expandido para os seus períodos
+    selic_anos_p, ipca_anos_p = _periodic_rates_by_year(cenario, periods_per_year)
+    taxas_por_ano = {
+        "selic_aa": cenario.selic_por_ano[:ANOS_SIMULACAO],
+        "ipca_aa": cenario.ipca_por_ano[:ANOS_SIMULACAO],
+        f"selic_{rate_suffix}": selic_anos_p,
+        f"ipca_{rate_suffix}": ipca_anos_p,
+    }
+
+    # Ano e índice do período cabem em inteiros menores
+    arrays = {
+        index_name: np.arange(1, total_periods + 1, dtype=np.int32),
+        "year": _expand_by_year(np.arange(2025, 2025 + ANOS_SIMULACAO, dtype=np.int16), periods_per_year, total_periods),
+    }
+    for coluna, por_ano in taxas_por_ano.items():
+        arrays[coluna] = _expand_by_year(por_ano.astype(float_dtype, copy=False), periods_per_year, total_periods)
+    return arrays
+
+
+def build_scenario_dataframe(
+    cenario: CenarioEconomico, granularity: str = "monthly", float_dtype=DTYPE_FLOAT
+) -> pd.DataFrame:
+    """Constrói DataFrame para o cenário com granularidade mensal ou diária."""
+    # Colunas numéricas já são arrays recém-criados: montadas sem cópia
+    arrays = build_scenario_arrays(cenario, granularity, float_dtype)
+    return _scenario_frame(cenario, arrays)
+
+
+def _scenario_frame(cenario: CenarioEconomico, arrays: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """DataFrame do cenário sobre ``arrays`` (colunas numéricas), sem copiá-los."""
+    total_periods = len(arrays["year"])
+    # O nome do cenário, igual em todas as linhas, vira uma categórica (um código por linha)
+    return pd.DataFrame({
+        "scenario": pd.Categorical.from_codes(np.zeros(total_periods, dtype=np.int8), categories=[cenario.nome]),
+        **arrays,
+    }, copy=False)
+
+
+# Criação automática dos cenários
+CENARIOS = {
+    key: CenarioEconomico(
+        nome=config["nome"],
+        descricao=config["descricao"],
+        selic_por_ano=config["selic_por_ano"],
+        ipca_por_ano=config["ipca_por_ano"],
+    )
+    for key, config in CENARIOS_CONFIG.items()
+}
+
+# Cache em disco opcional (SCENARIO_CACHE=1): um parquet com as colunas numéricas por
+# cenário e granularidade, reaproveitado entre processos. A versão entra na chave para invalidar arquivos antigos
+_SCENARIO_CACHE_VERSION = 2
+_SCENARIO_CACHE_DIR = CACHE_DIR / "scenarios"
+
+
+def _disk_cache_path(key: str, cenario: CenarioEconomico, granularity: str) -> Path:
+    """Arquivo parquet do cenário, com chave BLAKE2b sobre todas as entradas do build."""
+    conteudo = (
+        _SCENARIO_CACHE_VERSION, key, granularity, cenario.nome,
+        cenario.selic_por_ano.tolist(), cenario.ipca_por_ano.tolist(),
+        ANOS_SIMULACAO, DIAS_UTEIS_POR_ANO,
+    )
+    digest = hashlib.blake2b(repr(conteudo).encode("utf-8"), digest_size=8).hexdigest()
+    return _SCENARIO_CACHE_DIR / f"{digest}.parquet"
+
+
+def _read_disk_cache(path: Path) -> Dict[str, np.ndarray] | None:
+    """Arrays gravados em ``path`` pelo cache em disco, ou None se ausente/ilegível."""
+    from pyarrow import ArrowInvalid
+
+    try:
+        df = pd.read_parquet(path, engine="pyarrow")
+    except FileNotFoundError:
+        return None
+    except (OSError, ArrowInvalid) as exc:
+        # Arquivo corrompido ou parcial: avisa, reconstrói e regrava por cima
+        warnings.warn(f"Cache de cenário ilegível em {path} ({exc}); reconstruindo.", RuntimeWarning)
+        return None
+    return {coluna: df[coluna].to_numpy() for coluna in df.columns}
+
+
+def _write_disk_cache(path: Path, arrays: Dict[str, np.ndarray]) -> None:
+    """Grava ``arrays`` em parquet; falha de escrita não interrompe a simulação."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(arrays, copy=False).to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=16)
+def _arrays_cached(key: str, cenario: CenarioEconomico, granularity: str) -> Dict[str, np.ndarray]:
+    """Arrays do cenário ``key`` construídos uma única vez, somente leitura.
+
+    O próprio objeto ``cenario`` entra na chave do cache (hash por identidade):
+    reatribuir ``CENARIOS[key]`` gera uma nova entrada em vez de servir a antiga.
+    A DataFrame em cache (_build_cached) é montada sobre estes mesmos arrays.
+    Com SCENARIO_CACHE=1 os arrays também são lidos/gravados em parquet para
+    outros processos (vale para todos os caminhos, inclusive o lote diário da CLI).
+    """
+    if os.environ.get("SCENARIO_CACHE") != "1":
+        arrays = build_scenario_arrays(cenario, granularity)
+    else:
+        path = _disk_cache_path(key, cenario, granularity)
+        arrays = _read_disk_cache(path)
+        if arrays is None:
+            arrays = build_scenario_arrays(cenario, granularity)
+            _write_disk_cache(path, arrays)
+    for arr in arrays.values():
+        arr.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=16)
+def _build_cached(key: str, cenario: CenarioEconomico, granularity: str) -> pd.DataFrame:
+    """DataFrame do cenário ``key`` construída uma única vez por granularidade.
+
+    Chave como em _arrays_cached (inclui o objeto do cenário) e
+    build_scenario_dataframe é pura; quem chama recebe uma
+    cópia rasa, nunca o objeto guardado no cache. As colunas numéricas são os
+    arrays somente leitura de _arrays_cached (compartilhados, sem cópia defensiva):
+    com copy-on-write, escrever numa coluna da cópia rasa copia só aquela coluna.
+    """
+    return _scenario_frame(cenario, _arrays_cached(key, cenario, granularity))
+
+
+def get_scenario(key: str, granularity: str = "monthly") -> pd.DataFrame:
+    """Retorna DataFrame do cenário especificado."""
+    if key not in CENARIOS:
+        raise ValueError(f"Cenário '{key}' não encontrado. Disponíveis: {list(CENARIOS.keys())}")
+    # Cópia rasa: acrescentar colunas (ex.: include_daily_columns) não altera o cache
+    return _build_cached(key, CENARIOS[key], granularity).copy(deep=False)
+
+
+def get_scenario_arrays(key: str, granularity: str = "monthly") -> Dict[str, np.ndarray]:
+    """Retorna as colunas numéricas do cenário como ndarrays somente leitura."""
+    if key not in CENARIOS:
+        raise ValueError(f"Cenário '{key}' não encontrado. Disponíveis: {list(CENARIOS.keys())}")
+    # Dicionário novo a cada chamada; os arrays são os do cache (somente leitura)
+    return dict(_arrays_cached(key, CENARIOS[key], granularity))
+
+
+def get_all_scenarios_daily_arrays() -> Dict[str, Dict[str, np.ndarray]]:
+    """Retorna as colunas numéricas de todos os cenários diários, por nome do cenário."""
+    # Chaves vindas de CENARIOS: vai direto ao cache, sem a validação de get_scenario_arrays
+    return {
+        cenario.nome: dict(_arrays_cached(key, cenario, "daily"))
+        for key, cenario in CENARIOS.items()
+    }
+
+
+def get_all_scenarios_daily() -> Dict[str, pd.DataFrame]:
+    """Retorna todos os cenários em versão diária."""
+    # Chaves vindas de CENARIOS: vai direto ao cache, sem a validação de get_scenario
+    return {
+        cenario.nome: _build_cached(key, cenario, "daily").copy(deep=False)
+        for key, cenario in CENARIOS.items()
+    }
+
+
+def build_all_scenarios_long(granularity: str = "daily") -> pd.DataFrame:
+    """Todos os cenários numa única DataFrame "longa", indexada por (scenario, período).
+
+    Cada coluna numérica é concatenada uma vez a partir dos arrays em cache e o
+    nível ``scenario`` é categórico: ``df.xs(nome)`` devolve um cenário e as
+    comparações entre cenários operam sobre um só bloco contíguo por coluna.
+    """
+    itens = list(CENARIOS.items())
+    partes = [_arrays_cached(key, cenario, granularity) for key, cenario in itens]
+    colunas = {col: np.concatenate([arrays[col] for arrays in partes]) for col in partes[0]}
+    index_name = "month_index" if granularity == "monthly" else "day_index"
+
+    # Códigos do cenário por linha (um bloco por cenário, na ordem de CENARIOS)
+    codigos = np.repeat(np.arange(len(partes), dtype=np.int8), [len(arrays["year"]) for arrays in partes])
+    cenario = pd.Categorical.from_codes(codigos, categories=[c.nome for _, c in itens])
+    index = pd.MultiIndex.from_arrays([cenario, colunas.pop(index_name)], names=["scenario", index_name])
+    return pd.DataFrame(colunas, index=index, copy=False)
+
+
+def _add_daily_columns(df: pd.DataFrame, key: str) -> None:
+    """Acrescenta ao cenário mensal as colunas de taxa diária equivalente."""
+    # Taxa diária da tabela por ano (a mesma da construção diária), expandida para os meses
+    selic_d, ipca_d = _periodic_rates_by_year(CENARIOS[key], DIAS_UTEIS_POR_ANO)
+    df["selic_d"] = _expand_by_year(selic_d, 12, MESES_SIMULACAO)
+    df["ipca_d"] = _expand_by_year(ipca_d, 12, MESES_SIMULACAO)
+
+
+# Funções de compatibilidade (para não quebrar código existente)
+def _monthly_compat(key: str, include_daily_columns: bool) -> pd.DataFrame:
+    """Cenário mensal ``key``, opcionalmente com as colunas de taxa diária."""
+    df = get_scenario(key, "monthly")
+    if include_daily_columns:
+        _add_daily_columns(df, key)
+    return df
+
+def scenario_manutencao(include_daily_columns: bool = False) -> pd.DataFrame:
+    return _monthly_compat("Manutencao", include_daily_columns)
+
+def scenario_aperto(include_daily_columns: bool = False) -> pd.DataFrame:
+    return _monthly_compat("Aperto", include_daily_columns)
+
+def scenario_afrouxamento(include_daily_columns: bool = False) -> pd.DataFrame:
+    return _monthly_compat("Afrouxamento", include_daily_columns)
+
+def scenario_manutencao_daily() -> pd.DataFrame:
+    return get_scenario("Manutencao", "daily")
+
+def scenario_aperto_daily() -> pd.DataFrame:
+    return get_scenario("Aperto", "daily")
+
+def scenario_afrouxamento_daily() -> pd.DataFrame:
+    return get_scenario("Afrouxamento", "daily")
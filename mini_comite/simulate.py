@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+from .config import CAPITAL_INICIAL, DIAS_UTEIS_POR_ANO
+
+from .scenarios import (
+    scenario_manutencao_daily,
+    scenario_aperto_daily,
+    scenario_afrouxamento_daily,
+    get_scenario_arrays,
+    CENARIOS,
+)
+from .products import (
+    SimulationParams,
+    simulate_scenario_products,
+    scenarios_rates_matrix,
+    simulate_scenarios_matrix,
+)
+
+
+_SUMMARY_NUM_COLS = ("vf_bruto", "ir_final", "vf_liquido")
+# Registro do resumo por produto: um campo float64 por coluna numérica
+_SUMMARY_DTYPE = np.dtype([(col, np.float64) for col in _SUMMARY_NUM_COLS])
+
+
+def _build_summary(results: list) -> pd.DataFrame:
+    """Monta o resumo coluna a coluna, ordenado por VF líquido (decrescente).
+
+    Cada coluna numérica vira um array float64 1D contíguo, já na ordem final:
+    a ordenação é feita nos arrays (argsort) e a DataFrame é montada sem cópia,
+    dispensando sort_values/reset_index sobre uma DataFrame intermediária.
+    """
+    # Uma única passada pelos resultados, direto num array estruturado pré-dimensionado
+    # (um registro por produto), ordenado por VF líquido antes de virar colunas
+    valores = np.fromiter(
+        (tuple(r[col] for col in _SUMMARY_NUM_COLS) for r in results),
+        dtype=_SUMMARY_DTYPE, count=len(results),
+    )
+    ordem = np.argsort(-valores["vf_liquido"], kind="stable")
+    valores = valores[ordem]
+    data = {"produto": np.array([r["produto"] for r in results], dtype=object)[ordem]}
+    for col in _SUMMARY_NUM_COLS:
+        data[col] = np.ascontiguousarray(valores[col])
+    return pd.DataFrame(data, copy=False)
+
+
+def _daily_series(df: pd.DataFrame) -> tuple:
+    """Séries de um cenário diário usadas pelos produtos: (Selic diária, IPCA anual, Selic anual).
+
+    Saem como arrays float64 (sem cópia quando a coluna já é float64), prontos
+    para a matriz de taxas dos produtos.
+    """
+    selic_d = df["selic_d"].to_numpy(dtype=np.float64)
+    ipca_aa = df["ipca_aa"].to_numpy(dtype=np.float64)  # IPCA anual para Tesouro IPCA+
+    selic_aa = df["selic_aa"].to_numpy(dtype=np.float64)
+    return selic_d, ipca_aa, selic_aa
+
+
+def _daily_series_arrays(arrays: Dict[str, np.ndarray]) -> tuple:
+    """Como _daily_series, direto dos ndarrays do cenário (sem DataFrame)."""
+    return arrays["selic_d"], arrays["ipca_aa"], arrays["selic_aa"]
+
+
+def _monthly_series(df: pd.DataFrame) -> tuple:
+    """Séries de um cenário mensal usadas pelos produtos: (Selic mensal, IPCA mensal, Selic anual)."""
+    return (
+        df["selic_m"].to_numpy(dtype=np.float64),
+        df["ipca_m"].to_numpy(dtype=np.float64),
+        df["selic_aa"].to_numpy(dtype=np.float64),
+    )
+
+
+def _monthly_series_arrays(arrays: Dict[str, np.ndarray]) -> tuple:
+    """Como _monthly_series, direto dos ndarrays do cenário (sem DataFrame)."""
+    return arrays["selic_m"], arrays["ipca_m"], arrays["selic_aa"]
+
+
+def _daily_result(results: list, with_timelines: bool = True) -> Dict:
+    """Resumo e timelines de um cenário diário a partir dos resultados dos seis produtos."""
+    r_prefix, r_ipca, r_selic, r_cdb, r_lci, r_poup = results
+
+    # Cria resumo
+    summary_df = _build_summary(results)
+    
+    if not with_timelines:
+        return {"summary": summary_df, "timelines": {}, "arrays": {}}
+    
+    # Organiza timelines
+    timelines = {
+        "Tesouro_Prefixado": r_prefix["timeline"],
+        "Tesouro_IPCA_Plus": r_ipca["timeline"],
+        "Tesouro_Selic": r_selic["timeline"],
+        "CDB_100_CDI": r_cdb["timeline"],
+        "LCI": r_lci["timeline"],
+        "Poupanca": r_poup["timeline"],
+    }
+    
+    # Mesmas colunas como ndarrays (compartilham a memória das timelines)
+    arrays = {key: r["arrays"] for key, r in zip(timelines, results)}
+    
+    return {
+        "summary": summary_df,
+        "timelines": timelines,
+        "arrays": arrays,
+    }
+
+
+def _simulate_for_scenario_daily(df: pd.DataFrame, params: SimulationParams, with_timelines: bool = True) -> Dict:
+    """Executa todos os produtos para um DataFrame de cenário diário (756 linhas diárias).
+
+    Com ``with_timelines=False`` só o resumo é calculado e ``timelines`` fica vazio.
+    """
+    # Simula todos os produtos (agora com 756 dias úteis) numa única passada matricial:
+    # Prefixado (14% a.a.), IPCA+ (IPCA anual), Selic, CDB (CDI ≈ Selic - 0,1 p.p.),
+    # LCI (Selic diária) e poupança (Selic anual)
+    selic_d, ipca_aa, selic_aa = _daily_series(df)
+    results = simulate_scenario_products(
+        selic=selic_d, ipca=ipca_aa, selic_aa=selic_aa, params=params, with_timeline=with_timelines
+    )
+    return _daily_result(results, with_timelines)
+
+
+def _simulate_for_scenario(df: pd.DataFrame, params: SimulationParams) -> pd.DataFrame:
+    """Executa todos os produtos para um DataFrame de cenário mensal (36 linhas mensais)."""
+    selic_m, ipca_m, selic_aa = _monthly_series(df)
+
+    # Só o resumo é usado: as timelines não chegam a ser montadas
+    results = simulate_scenario_products(
+        selic=selic_m, ipca=ipca_m, selic_aa=selic_aa, params=params, with_timeline=False
+    )
+
+    df_summary = _build_summary(results)
+    return df_summary
+
+
+# Cenários de compatibilidade usados por run_all (mensal)
+_RUN_ALL_KEYS = ("Manutencao", "Aperto", "Afrouxamento")
+
+
+@lru_cache(maxsize=8)
+def _cached_rates_matrix(items: tuple, granularity: str, params: SimulationParams) -> np.ndarray:
+    """Matriz de taxas (cenários × produtos, períodos) dos pares (chave, cenário) ``items``, em cache.
+
+    As taxas só dependem dos cenários e de ``params`` (congelado, hashable): chamadas
+    repetidas com os mesmos parâmetros reaproveitam a matriz. Os objetos dos cenários
+    fazem parte da chave, então reatribuir uma entrada de CENARIOS não serve taxas
+    antigas. Somente leitura.
+    """
+    series = _daily_series_arrays if granularity == "daily" else _monthly_series_arrays
+    matrix = scenarios_rates_matrix([series(get_scenario_arrays(key, granularity)) for key, _ in items], params)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def run_all(initial_value: float = CAPITAL_INICIAL) -> Dict[str, pd.DataFrame]:
+    """Roda todos os cenários com parâmetros padrão e retorna resumos por cenário."""
+    params = SimulationParams(initial=initial_value, annual_custody=0.002, periods_per_year=12)
+
+    # Os três cenários de compatibilidade (manutenção, aperto, afrouxamento) × seis
+    # produtos numa só matriz (18 linhas), montada a partir dos arrays em cache
+    batches = simulate_scenarios_matrix(
+        _cached_rates_matrix(tuple((key, CENARIOS[key]) for key in _RUN_ALL_KEYS), "monthly", params),
+        params, with_timeline=False,
+    )
+    return {
+        CENARIOS[key].nome: _build_summary(results)
+        for key, results in zip(_RUN_ALL_KEYS, batches)
+    }
+
+def run_all_with_timelines(initial_value: float = CAPITAL_INICIAL, with_timelines: bool = True) -> Dict[str, Dict]:
+    """Roda todos os cenários configurados e retorna resumos + timelines completas por cenário.
+
+    Com ``with_timelines=False`` (quem só precisa dos resumos) as timelines não são montadas.
+    """
+    params = SimulationParams(initial=initial_value, annual_custody=0.002, periods_per_year=DIAS_UTEIS_POR_ANO)
+
+    # Usa todos os cenários configurados dinamicamente. Todos os cenários × produtos
+    # numa única passada matricial (cenários com o mesmo número de dias úteis),
+    # separados por cenário só na montagem do resultado
+    items = tuple(CENARIOS.items())
+    batches = simulate_scenarios_matrix(
+        _cached_rates_matrix(items, "daily", params), params, with_timeline=with_timelines
+    )
+    return {
+        cenario.nome: _daily_result(results, with_timelines)
+        for (_, cenario), results in zip(items, batches)
+    }
+
+
+def main() -> None:
+    res = run_all()
+    for scen_name, df in res.items():
+        print(f"\n=== {scen_name} ===")
+        print(df.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
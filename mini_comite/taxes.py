@@ -0,0 +1,214 @@
+"""
+Funções para cálculo de impostos e taxas.
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+
+# Tabela regressiva do Imposto de Renda (conforme legislação brasileira)
+TABELA_IR = [
+    {"dias_min": 0,   "dias_max": 180, "aliquota": 0.225},  # 22,5% até 180 dias
+    {"dias_min": 181, "dias_max": 360, "aliquota": 0.20},   # 20% de 181 a 360 dias  
+    {"dias_min": 361, "dias_max": 720, "aliquota": 0.175},  # 17,5% de 361 a 720 dias
+    {"dias_min": 721, "dias_max": 9999, "aliquota": 0.15}   # 15% acima de 720 dias
+]
+
+# Mesma tabela em forma de busca: limites superiores das faixas (exceto a última,
+# aberta) e alíquotas na ordem das faixas. A faixa de ``dias`` é o número de
+# limites estritamente menores que ele (bisect_left / searchsorted "left")
+_LIMITES_IR = tuple(faixa["dias_max"] for faixa in TABELA_IR[:-1])
+_ALIQUOTAS_IR = tuple(faixa["aliquota"] for faixa in TABELA_IR)
+_LIMITES_IR_NP = np.array(_LIMITES_IR, dtype=np.int64)
+_ALIQUOTAS_IR_NP = np.array(_ALIQUOTAS_IR, dtype=np.float64)
+
+# Descrição de cada faixa, já formatada (mesma ordem de TABELA_IR)
+_FAIXAS_IR = ("até 180 dias", "181-360 dias", "361-720 dias", "acima de 720 dias")
+_DESCRICOES_IR = tuple(f"{aliquota:.1%} ({faixa})" for aliquota, faixa in zip(_ALIQUOTAS_IR, _FAIXAS_IR))
+
+
+def get_ir_rate_by_days(dias: int) -> float:
+    """Retorna a alíquota de IR baseada no número de dias de aplicação.
+    
+    Tabela regressiva:
+    - Até 180 dias: 22,5%
+    - De 181 a 360 dias: 20%
+    - De 361 a 720 dias: 17,5%
+    - Acima de 720 dias: 15%
+    
+    Args:
+        dias: Número de dias de aplicação
+        
+    Returns:
+        float: Alíquota de IR (ex: 0.225 para 22,5%)
+    """
+    if dias < 0:
+        # Fora da tabela: mesmo fallback de prazos extremos
+        return _ALIQUOTAS_IR[-1]  # 15%
+    # Busca binária nos limites das faixas (acima de 9999 dias cai na última, 15%)
+    return _ALIQUOTAS_IR[bisect_left(_LIMITES_IR, dias)]
+
+
+def get_ir_rates_by_days_array(dias) -> np.ndarray:
+    """Versão vetorizada de get_ir_rate_by_days para um array de dias inteiros.
+
+    Args:
+        dias: Array (ou sequência) de números de dias de aplicação
+
+    Returns:
+        np.ndarray: Alíquotas de IR (float64), uma por elemento de ``dias``
+    """
+    dias = np.asarray(dias)
+    aliquotas = _ALIQUOTAS_IR_NP[np.searchsorted(_LIMITES_IR_NP, dias, side="left")]
+    # Dias negativos: mesmo fallback de get_ir_rate_by_days
+    return np.where(dias < 0, _ALIQUOTAS_IR_NP[-1], aliquotas)
+
+
+# Conversão dias úteis → dias corridos: 365.25 dias/ano ÷ 252 dias úteis/ano (≈ 1.449)
+_FATOR_DIAS_CORRIDOS_DIARIO = 365.25 / 252
+# Aproximação de 30 dias corridos por mês
+_DIAS_POR_MES = 30
+
+
+def _ir_rate_daily(periodo: int) -> float:
+    """Alíquota de IR do período (0-based) de uma simulação diária (252 dias úteis/ano)."""
+    return get_ir_rate_by_days(int((periodo + 1) * _FATOR_DIAS_CORRIDOS_DIARIO))
+
+
+def _ir_rate_monthly(periodo: int) -> float:
+    """Alíquota de IR do período (0-based) de uma simulação mensal."""
+    return get_ir_rate_by_days((periodo + 1) * _DIAS_POR_MES)
+
+
+# Alíquota por período especializada para cada frequência conhecida: quem calcula
+# muitos períodos escolhe a função uma vez, sem ramificar a cada chamada
+IR_RATE_FNS = {252: _ir_rate_daily, 12: _ir_rate_monthly}
+
+
+def get_ir_rate_by_periods(periodo: int, periods_per_year: int) -> float:
+    """Retorna a alíquota de IR baseada no período de aplicação.
+    
+    Converte períodos (dias úteis ou meses) para dias corridos conforme 
+    a tabela regressiva do IR que usa dias de calendário.
+    
+    Args:
+        periodo: Número do período (0-based)
+        periods_per_year: Períodos por ano (12 para mensal, 252 para diário)
+        
+    Returns:
+        float: Alíquota de IR
+    """
+    # Conversão período → dias corridos escolhida pela frequência (qualquer outra
+    # frequência que não a diária segue a aproximação mensal)
+    return IR_RATE_FNS.get(periods_per_year, _ir_rate_monthly)(periodo)
+
+
+def get_ir_rates_by_periods_array(periodos, periods_per_year: int) -> np.ndarray:
+    """Versão vetorizada de get_ir_rate_by_periods para um array de períodos (0-based).
+
+    Args:
+        periodos: Array (ou sequência) de números de período
+        periods_per_year: Períodos por ano (12 para mensal, 252 para diário)
+
+    Returns:
+        np.ndarray: Alíquotas de IR (float64), uma por período
+    """
+    periodos = np.asarray(periodos, dtype=np.int64)
+    # Mesma conversão para dias corridos de get_ir_rate_by_periods
+    if periods_per_year == 252:
+        # int() trunca em direção a zero, como astype: idêntico para períodos >= 0
+        dias_corridos = ((periodos + 1) * _FATOR_DIAS_CORRIDOS_DIARIO).astype(np.int64)
+    else:
+        dias_corridos = (periodos + 1) * _DIAS_POR_MES
+    return get_ir_rates_by_days_array(dias_corridos)
+
+
+def calculate_ir_provision(valor_inicial: float, saldo_atual: float, periodo: int, periods_per_year: int, ir_exempt: bool = False) -> float:
+    """Calcula a provisão de IR baseada no tempo de aplicação.
+    
+    Args:
+        valor_inicial: Valor inicial investido
+        saldo_atual: Saldo atual bruto
+        periodo: Período atual (0-based)
+        periods_per_year: Períodos por ano
+        ir_exempt: Se o produto é isento de IR
+        
+    Returns:
+        float: Valor da provisão de IR
+    """
+    if ir_exempt or saldo_atual <= valor_inicial:
+        return 0.0
+    
+    rendimento = saldo_atual - valor_inicial
+    aliquota_ir = get_ir_rate_by_periods(periodo, periods_per_year)
+    
+    return rendimento * aliquota_ir
+
+
+def calculate_ir_provision_series(valor_inicial: float, saldos, periods_per_year: int, ir_exempt: bool = False) -> np.ndarray:
+    """Provisão de IR de uma série de saldos brutos, período a período (0, 1, ...).
+
+    Equivale a chamar calculate_ir_provision para cada período, em poucas
+    operações vetorizadas sobre a série inteira.
+
+    Args:
+        valor_inicial: Valor inicial investido
+        saldos: Saldos brutos por período (o último eixo é o período)
+        periods_per_year: Períodos por ano
+        ir_exempt: Se o produto é isento de IR
+
+    Returns:
+        np.ndarray: Provisão de IR por período (mesma forma de ``saldos``)
+    """
+    saldos = np.asarray(saldos, dtype=np.float64)
+    if ir_exempt:
+        return np.zeros_like(saldos)
+    aliquotas = get_ir_rates_by_periods_array(np.arange(saldos.shape[-1]), periods_per_year)
+    return np.maximum(saldos - valor_inicial, 0.0) * aliquotas
+
+
+def get_ir_description_by_days(dias: int) -> str:
+    """Retorna descrição da faixa de IR baseada no número de dias.
+    
+    Args:
+        dias: Número de dias de aplicação
+        
+    Returns:
+        str: Descrição da faixa (ex: "22,5% (até 180 dias)")
+    """
+    if dias < 0:
+        # Alíquota do fallback de get_ir_rate_by_days, na descrição da primeira faixa
+        return f"{_ALIQUOTAS_IR[-1]:.1%} ({_FAIXAS_IR[0]})"
+    # Uma busca dá a faixa, e com ela a descrição pronta (alíquota + prazo)
+    return _DESCRICOES_IR[bisect_left(_LIMITES_IR, dias)]
+
+
+def get_ir_descriptions_by_days_array(dias) -> np.ndarray:
+    """Versão vetorizada de get_ir_description_by_days para um array de dias inteiros.
+
+    Args:
+        dias: Array (ou sequência) de números de dias de aplicação
+
+    Returns:
+        np.ndarray: Descrições (object), uma por elemento de ``dias``
+    """
+    dias = np.asarray(dias)
+    descricoes = np.array(_DESCRICOES_IR, dtype=object)[np.searchsorted(_LIMITES_IR_NP, dias, side="left")]
+    negativos = dias < 0
+    if negativos.any():
+        descricoes[negativos] = get_ir_description_by_days(-1)
+    return descricoes
+
+
+def get_ir_schedule_summary() -> str:
+    """Retorna resumo da tabela regressiva de IR.
+    
+    Returns:
+        str: Resumo formatado da tabela
+    """
+    summary = "Tabela Regressiva do Imposto de Renda:\n"
+    summary += "• Até 180 dias: 22,5%\n"
+    summary += "• De 181 a 360 dias: 20,0%\n"
+    summary += "• De 361 a 720 dias: 17,5%\n"
+    summary += "• Acima de 720 dias: 15,0%\n"
+    return summary
\ No newline at end of file